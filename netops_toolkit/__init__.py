@@ -4,11 +4,54 @@ NetOps Toolkit - 网络工程实施及测试工具集
 面向网络工程师的多功能CLI工具箱,集成网络实施、测试、巡检、诊断功能。
 """
 
-__version__ = "1.0.0"
-__author__ = "Network Engineering Team"
-__license__ = "MIT"
+import os
 
-from .core.logger import get_logger
+__version__ = "1.0.0"
 
 # 导出常用组件
 __all__ = ["__version__", "get_logger"]
+
+# 延迟导出: 名称 -> (模块, 属性), 首次访问时才导入 (PEP 562)
+_LAZY_EXPORTS = {
+    "get_logger": (".core.logger", "get_logger"),
+}
+
+# 包元数据属性: 名称 -> (元数据字段, 未安装时的回退值)
+_METADATA_ATTRS = {
+    "__author__": (("Author", "Author-email"), "Network Engineering Team"),
+    "__license__": (("License",), "MIT"),
+}
+
+
+def __getattr__(name: str):
+    """按需加载延迟导出的属性"""
+    if name in _LAZY_EXPORTS:
+        from importlib import import_module
+
+        module_name, attr = _LAZY_EXPORTS[name]
+        value = getattr(import_module(module_name, __name__), attr)
+        globals()[name] = value
+        return value
+    if name in _METADATA_ATTRS:
+        from importlib.metadata import PackageNotFoundError, metadata
+
+        fields, value = _METADATA_ATTRS[name]
+        try:
+            meta = metadata("netops-toolkit")
+            value = next((meta[f] for f in fields if meta.get(f)), value)
+        except PackageNotFoundError:
+            pass
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+# NETOPS_EAGER_IMPORT=1 时立即解析全部延迟导出 (用于CI提前暴露导入错误)
+if os.environ.get("NETOPS_EAGER_IMPORT") == "1":
+    for _name in _LAZY_EXPORTS:
+        __getattr__(_name)
+    del _name
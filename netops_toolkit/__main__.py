@@ -11,37 +11,129 @@ NetOps Toolkit 入口点
 """
 
 import sys
+from functools import lru_cache
+
+# 静态帮助文本 (与 cli.py 中注册的子命令保持一致), 避免仅为 --help 导入 Typer 命令树
+STATIC_USAGE = """\
+Usage: python -m netops_toolkit [OPTIONS] COMMAND [ARGS]...
+
+NetOps Toolkit - 网络工程实施及测试工具集
+
+无参数运行进入交互式模式,或使用子命令执行特定功能。
+
+Options:
+  --version, -v    显示版本号
+  --interactive    启动交互式菜单
+  --cli            使用 CLI 模式
+  --help, -h       显示帮助信息
+
+Commands:
+  ping           Ping测试 - 检测网络连通性
+  scan           端口扫描 - 检测开放端口
+  dns            DNS查询 - 域名解析
+  ssh-batch      SSH批量执行 - 在多台设备上执行命令
+  config-backup  配置备份 - 备份设备配置
+  traceroute     路由追踪 - 追踪到目标的网络路径
+  http           HTTP调试 - 测试HTTP/HTTPS请求
+  subnet         子网计算器 - 计算网络信息
+  quality        网络质量测试 - 综合评估延迟、抖动、丢包率
+  speedtest      带宽测速 - 测试网络上下行带宽
+  ip-convert     IP格式转换 - 十进制/二进制/十六进制/整数
+  mac-lookup     MAC地址查询 - 厂商识别和格式转换
+  arp-scan       ARP扫描 - 局域网主机发现
+  config-diff    配置对比 - 对比两个配置文件的差异
+  whois          WHOIS查询 - 域名/IP注册信息查询
+
+使用 "python -m netops_toolkit COMMAND --help" 查看子命令详细帮助。
+"""
+
+
+# 快速路径参数
+VERSION_FLAGS = frozenset({"--version", "-v"})
+HELP_FLAGS = frozenset({"--help", "-h"})
 
 
 def main():
     """主入口函数"""
-    args = sys.argv[1:]
-    
-    # 检查模式参数
-    if "--interactive" in args:
-        # 交互式模式
-        args.remove("--interactive")
-        run_interactive_mode()
-    elif "--cli" in args or len(args) > 0:
-        # CLI 模式 (有其他参数时也进入 CLI)
-        if "--cli" in args:
-            args.remove("--cli")
-        run_cli_mode()
+    argv = sys.argv
+    # 常见情况只需判断第一个参数
+    first = argv[1] if len(argv) > 1 else None
+
+    # 快速路径: 仅查询版本或帮助时无需加载 CLI
+    if len(argv) == 2:
+        if first in VERSION_FLAGS:
+            from netops_toolkit import __version__
+            print(f"NetOps Toolkit v{__version__}")
+            return
+        if first in HELP_FLAGS:
+            print(STATIC_USAGE, end="")
+            return
+
+    # 模式参数在第一个位置时一次字典查找完成分派
+    if first in MODES:
+        load_entry = MODES[first]
+        # 从 sys.argv 中移除模式参数, 避免传给 Typer
+        del argv[1]
+    elif first is not None:
+        # 模式参数也可能出现在其他选项之后 (如 --verbose --interactive),
+        # 按 MODES 顺序查找, --interactive 优先; 都没有时进入 CLI
+        load_entry = _load_cli_app
+        for flag, mode_loader in MODES.items():
+            if flag in argv:
+                load_entry = mode_loader
+                argv.remove(flag)
+                break
+    elif not (sys.stdin.isatty() and sys.stdout.isatty()):
+        # 非交互终端 (管道、cron、CI) 无法使用菜单, 直接输出帮助
+        print(STATIC_USAGE, end="")
+        return
     else:
         # 默认启动交互式模式
-        run_interactive_mode()
+        load_entry = _load_interactive_main
+
+    # 只在加载入口时把 ImportError 视为依赖缺失; 运行中的 ImportError 保留原始回溯
+    try:
+        entry = load_entry()
+    except ImportError as e:
+        # 依赖缺失时一次性写入 stderr, 不污染 stdout 管道
+        sys.stderr.write(
+            f"模块加载失败: {e}\n"
+            "请确保已安装依赖: pip install -r requirements.txt\n"
+        )
+        sys.exit(1)
+    entry()
+
+
+@lru_cache(maxsize=None)
+def _load_interactive_main():
+    """加载交互式模式入口 (仅首次调用时导入)"""
+    from netops_toolkit.interactive import main as interactive_main
+    return interactive_main
+
+
+@lru_cache(maxsize=None)
+def _load_cli_app():
+    """加载 CLI 应用 (仅首次调用时导入)"""
+    from netops_toolkit.cli import app, register_commands
+    register_commands(sys.argv[1:])
+    return app
 
 
 def run_interactive_mode():
     """运行交互式模式"""
-    from netops_toolkit.interactive import main as interactive_main
-    interactive_main()
+    _load_interactive_main()()
 
 
 def run_cli_mode():
     """运行 CLI 模式"""
-    from netops_toolkit.cli import app
-    app()
+    _load_cli_app()()
+
+
+# 模式参数 -> 入口加载函数
+MODES = {
+    "--interactive": _load_interactive_main,
+    "--cli": _load_cli_app,
+}
 
 
 if __name__ == "__main__":
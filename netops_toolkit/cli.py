@@ -4,28 +4,23 @@ NetOps Toolkit CLI 入口
 基于Typer构建的CLI框架,支持命令行和交互式两种模式。
 """
 
+import importlib
 import sys
-from pathlib import Path
-from typing import List, Optional
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
 
-import questionary
 import typer
-from rich.console import Console
 
 from netops_toolkit import __version__
-from netops_toolkit.config.config_manager import get_config
+from netops_toolkit.config.config_manager import ConfigManager, get_config
 from netops_toolkit.core.logger import setup_logging, get_logger, log_audit
 from netops_toolkit.plugins import (
     Plugin,
     PluginCategory,
     get_registered_plugins,
-)
-from netops_toolkit.ui.theme import NetOpsTheme, console
-from netops_toolkit.ui.components import (
-    create_header_panel,
-    create_summary_panel,
-    print_banner,
-    print_separator,
+    get_registered_plugins_for,
+    get_registry_version,
 )
 
 # 创建Typer应用
@@ -39,9 +34,45 @@ app = typer.Typer(
 logger = get_logger(__name__)
 
 
-def init_app() -> None:
-    """初始化应用程序"""
-    config = get_config()
+class _LazyConsole:
+    """Rich Console 代理, 首次使用时才导入UI主题模块"""
+    
+    def __getattr__(self, name: str):
+        from netops_toolkit.ui.theme import console as rich_console
+        return getattr(rich_console, name)
+    
+    # with console: 期间的输出先进入缓冲区, 退出时一次性写出
+    def __enter__(self):
+        from netops_toolkit.ui.theme import console as rich_console
+        return rich_console.__enter__()
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        from netops_toolkit.ui.theme import console as rich_console
+        return rich_console.__exit__(exc_type, exc_val, exc_tb)
+
+
+# 全局Console (questionary 与 UI组件 在交互式函数内按需导入)
+console = _LazyConsole()
+
+
+# 应用是否已初始化 (避免重复配置日志处理器)
+_app_initialized = False
+
+
+def init_app(config: Optional[ConfigManager] = None) -> None:
+    """
+    初始化应用程序 (重复调用时直接返回)
+    
+    Args:
+        config: 配置管理器 (None表示使用全局配置)
+    """
+    global _app_initialized
+    
+    if _app_initialized:
+        return
+    
+    if config is None:
+        config = get_config()
     
     # 初始化日志系统
     log_level = config.get("app.log_level", "INFO")
@@ -54,88 +85,108 @@ def init_app() -> None:
         enable_file=True,
     )
     
+    _app_initialized = True
     logger.debug("NetOps Toolkit 已初始化")
 
 
-def show_banner() -> None:
+def show_banner(config: Optional[ConfigManager] = None) -> None:
     """显示应用横幅"""
-    config = get_config()
+    if config is None:
+        config = get_config()
     
     if config.get("ui.show_banner", True):
-        print_banner("NetOps Toolkit", __version__)
-        console.print()
+        from netops_toolkit.ui.components import print_banner
+        # 横幅与空行合并为一次写出
+        with console:
+            print_banner("NetOps Toolkit", __version__)
+            console.print()
+
+
+# 插件分类缓存 (以注册表版本号为键, 插件注册后自动失效)
+_category_cache: Optional[dict] = None
+_category_cache_key: Optional[int] = None
+
+
+def invalidate_plugin_cache() -> None:
+    """清除插件分类缓存"""
+    global _category_cache, _category_cache_key
+    _category_cache = None
+    _category_cache_key = None
 
 
 def get_plugins_by_category() -> dict:
     """
     按分类获取已注册的插件
     
+    结果会被缓存, 直到有新插件注册。
+    
     Returns:
         {category: [plugin_classes]} 字典
     """
+    global _category_cache, _category_cache_key
+    
+    key = get_registry_version()
+    if _category_cache is not None and _category_cache_key == key:
+        return _category_cache
+    
     plugins = get_registered_plugins()
-    categorized = {}
+    categorized = defaultdict(list)
     
-    for name, plugin_class in plugins.items():
-        category = plugin_class.category
-        if category not in categorized:
-            categorized[category] = []
-        categorized[category].append(plugin_class)
+    for plugin_class in plugins.values():
+        categorized[plugin_class.category].append(plugin_class)
     
-    return categorized
+    _category_cache = dict(categorized)
+    _category_cache_key = key
+    return _category_cache
+
+
+# 分类显示顺序 (元组迭代快于遍历 Enum 类)
+_CATEGORY_ORDER = tuple(PluginCategory)
+
+# 主菜单分类模板: (分类, 图标+名称), 导入时计算一次
+_CATEGORY_TEMPLATE = tuple(
+    (category, f"{category.icon} {category.display_name}")
+    for category in _CATEGORY_ORDER
+)
+
+# 主菜单固定尾部选项: (标题, 值), 分隔线在构建菜单时添加
+_STATIC_TAIL = (
+    ("⚙️  设置", "settings"),
+    ("ℹ️  关于", "about"),
+    ("🚪 退出", "exit"),
+)
 
 
-def build_main_menu() -> List[dict]:
+def build_main_menu() -> list:
     """
     构建主菜单选项
     
     Returns:
         菜单选项列表
     """
-    category_icons = {
-        PluginCategory.DIAGNOSTICS: "🔍",
-        PluginCategory.DEVICE_MGMT: "🖥️",
-        PluginCategory.SCANNING: "📡",
-        PluginCategory.PERFORMANCE: "⚡",
-        PluginCategory.UTILS: "🛠️",
-    }
-    
-    category_names = {
-        PluginCategory.DIAGNOSTICS: "诊断工具",
-        PluginCategory.DEVICE_MGMT: "设备管理",
-        PluginCategory.SCANNING: "网络扫描",
-        PluginCategory.PERFORMANCE: "性能测试",
-        PluginCategory.UTILS: "实用工具",
-    }
+    import questionary
     
     plugins_by_category = get_plugins_by_category()
     
     menu_items = []
     
-    for category in PluginCategory:
-        plugins = plugins_by_category.get(category, [])
-        icon = category_icons.get(category, "•")
-        name = category_names.get(category, category.value)
-        count = len(plugins)
+    for category, label in _CATEGORY_TEMPLATE:
+        count = len(plugins_by_category.get(category, ()))
         
-        menu_items.append({
-            "name": f"{icon} {name} ({count})",
-            "value": category,
-            "disabled": "无可用插件" if count == 0 else None,
-        })
+        menu_items.append(questionary.Choice(
+            title=f"{label} ({count})",
+            value=category,
+            disabled="无可用插件" if count == 0 else None,
+        ))
     
     # 添加其他菜单项
-    menu_items.extend([
-        questionary.Separator("─" * 30),
-        {"name": "⚙️  设置", "value": "settings"},
-        {"name": "ℹ️  关于", "value": "about"},
-        {"name": "🚪 退出", "value": "exit"},
-    ])
+    menu_items.append(questionary.Separator("─" * 30))
+    menu_items.extend(questionary.Choice(title=title, value=value) for title, value in _STATIC_TAIL)
     
     return menu_items
 
 
-def build_plugin_menu(category: PluginCategory) -> List[dict]:
+def build_plugin_menu(category: PluginCategory) -> list:
     """
     构建插件子菜单
     
@@ -145,19 +196,20 @@ def build_plugin_menu(category: PluginCategory) -> List[dict]:
     Returns:
         菜单选项列表
     """
-    plugins_by_category = get_plugins_by_category()
-    plugins = plugins_by_category.get(category, [])
+    import questionary
+    
+    plugins = get_registered_plugins_for(category)
     
     menu_items = []
     
+    # 菜单标题和描述均为类属性, 无需实例化插件
     for plugin_class in plugins:
-        plugin = plugin_class()
-        menu_items.append({
-            "name": f"{plugin.get_menu_title()} - {plugin.description}",
-            "value": plugin_class,
-        })
+        menu_items.append(questionary.Choice(
+            title=f"{plugin_class.get_menu_title()} - {plugin_class.description}",
+            value=plugin_class,
+        ))
     
-    menu_items.append({"name": "⬅️  返回上级", "value": "back"})
+    menu_items.append(questionary.Choice(title="⬅️  返回上级", value="back"))
     
     return menu_items
 
@@ -172,13 +224,16 @@ def show_about() -> None:
         "许可证": "MIT License",
     }
     
+    from netops_toolkit.ui.components import create_summary_panel
+    
     panel = create_summary_panel("关于 NetOps Toolkit", about_info)
     console.print(panel)
 
 
-def show_settings() -> None:
+def show_settings(config: Optional[ConfigManager] = None) -> None:
     """显示设置信息"""
-    config = get_config()
+    if config is None:
+        config = get_config()
     
     settings_info = {
         "日志级别": config.get("app.log_level", "INFO"),
@@ -189,214 +244,304 @@ def show_settings() -> None:
         "密码加密": "启用" if config.get("security.encrypt_passwords", True) else "禁用",
     }
     
+    from netops_toolkit.ui.components import create_summary_panel
+    
     panel = create_summary_panel("当前设置", settings_info)
     console.print(panel)
 
 
+# 交互会话内已初始化的插件实例: 插件类 -> 实例 (会话结束时统一清理)
+_session_plugins: Dict[type, Plugin] = {}
+
+
+def _get_session_plugin(plugin_class: type) -> Optional[Plugin]:
+    """
+    获取会话内已初始化的插件实例, 首次使用时创建并初始化
+    
+    Args:
+        plugin_class: 插件类
+        
+    Returns:
+        插件实例, 初始化失败时返回None (不缓存)
+    """
+    plugin = _session_plugins.get(plugin_class)
+    if plugin is None:
+        plugin = plugin_class()
+        if not plugin.initialize():
+            return None
+        _session_plugins[plugin_class] = plugin
+    return plugin
+
+
+def cleanup_session_plugins() -> None:
+    """清理会话内缓存的全部插件 (每个实例只清理一次)"""
+    while _session_plugins:
+        _, plugin = _session_plugins.popitem()
+        try:
+            plugin.cleanup()
+        except Exception as e:
+            logger.warning(f"插件清理失败: {plugin.name}: {e}")
+
+
 def run_plugin_interactive(plugin_class: type) -> None:
     """
     交互式运行插件
     
+    插件实例在会话内复用, 由 cleanup_session_plugins() 统一清理。
+    
     Args:
         plugin_class: 插件类
     """
-    plugin = plugin_class()
+    import questionary
     
     # 显示插件信息
-    console.print(f"\n[bold cyan]>>> {plugin.name}[/bold cyan]")
-    console.print(f"[dim]{plugin.description}[/dim]\n")
+    with console:
+        console.print(f"\n[bold cyan]>>> {plugin_class.name}[/bold cyan]")
+        console.print(f"[dim]{plugin_class.description}[/dim]\n")
     
-    # 初始化插件
-    if not plugin.initialize():
+    # 获取 (或首次初始化) 插件
+    plugin = _get_session_plugin(plugin_class)
+    if plugin is None:
         console.print("[red]插件初始化失败[/red]")
         return
     
-    try:
-        # 获取参数规格
-        params_spec = plugin.get_required_params()
-        params = {}
-        
-        # 交互式收集参数
-        for spec in params_spec:
-            if spec.choices:
-                # 选择题
-                value = questionary.select(
-                    f"{spec.description}:",
-                    choices=spec.choices,
-                    default=spec.default,
-                ).ask()
-            elif spec.param_type == bool:
-                # 布尔值
-                value = questionary.confirm(
-                    f"{spec.description}",
-                    default=spec.default if spec.default is not None else True,
-                ).ask()
-            elif spec.param_type == list:
-                # 列表 (逗号分隔)
-                raw = questionary.text(
-                    f"{spec.description} (逗号分隔):",
-                    default=",".join(spec.default) if spec.default else "",
-                ).ask()
-                value = [x.strip() for x in raw.split(",") if x.strip()]
-            else:
-                # 文本输入
-                value = questionary.text(
-                    f"{spec.description}:",
-                    default=str(spec.default) if spec.default is not None else "",
-                ).ask()
-            
-            if value is None:  # 用户取消
-                console.print("[yellow]操作已取消[/yellow]")
-                return
-            
-            params[spec.name] = value
-        
-        # 执行插件
-        console.print()
-        result = plugin.run(**params)
+    # 获取参数规格
+    params_spec = plugin.get_required_params()
+    params = {}
+    
+    # 交互式收集参数
+    for spec in params_spec:
+        if spec.choices:
+            # 选择题
+            value = questionary.select(
+                f"{spec.description}:",
+                choices=spec.choices,
+                default=spec.default if spec.is_valid_choice(spec.default) else None,
+            ).ask()
+        elif spec.param_type == bool:
+            # 布尔值
+            value = questionary.confirm(
+                f"{spec.description}",
+                default=spec.default if spec.default is not None else True,
+            ).ask()
+        elif spec.param_type == list:
+            # 列表 (逗号分隔)
+            raw = questionary.text(
+                f"{spec.description} (逗号分隔):",
+                default=",".join(spec.default) if spec.default else "",
+            ).ask()
+            # 每项只 strip 一次, filter(None, ...) 丢弃空项; 用户取消时保持 None
+            value = (
+                None if raw is None
+                else list(filter(None, map(str.strip, raw.split(","))))
+            )
+        else:
+            # 文本输入
+            value = questionary.text(
+                f"{spec.description}:",
+                default=str(spec.default) if spec.default is not None else "",
+            ).ask()
         
-        # 记录审计日志
-        log_audit(
-            user="interactive",
-            action=plugin.name,
-            target=str(params),
-            result=result.status.value,
-        )
+        if value is None:  # 用户取消
+            console.print("[yellow]操作已取消[/yellow]")
+            return
         
-        # 显示结果
-        if result.is_success:
-            console.print(f"\n[green]✅ {result.message}[/green]")
-        else:
-            console.print(f"\n[red]❌ {result.message}[/red]")
-            for error in result.errors:
-                console.print(f"  [red]• {error}[/red]")
-                
-    finally:
-        plugin.cleanup()
+        params[spec.name] = value
+    
+    # 执行插件
+    console.print()
+    result = plugin.run(**params)
+    
+    # 记录审计日志
+    log_audit(
+        user="interactive",
+        action=plugin.name,
+        target=str(params),
+        result=result.status.value,
+    )
+    
+    # 显示结果
+    if result.is_success:
+        console.print(f"\n[green]✅ {result.message}[/green]")
+    else:
+        console.print(f"\n[red]❌ {result.message}[/red]")
+        for error in result.errors:
+            console.print(f"  [red]• {error}[/red]")
 
 
-def interactive_mode() -> None:
-    """交互式菜单模式"""
-    show_banner()
+def interactive_mode(config: Optional[ConfigManager] = None) -> None:
+    """
+    交互式菜单模式
     
-    while True:
-        try:
-            # 主菜单
-            menu_items = build_main_menu()
+    Args:
+        config: 配置管理器 (None表示使用全局配置)
+    """
+    import questionary
+    
+    if config is None:
+        config = get_config()
+    
+    show_banner(config)
+    
+    try:
+        while True:
+            try:
+                # 主菜单
+                menu_items = build_main_menu()
             
-            choice = questionary.select(
-                "请选择功能:",
-                choices=menu_items,
-                style=questionary.Style([
-                    ("selected", "fg:cyan bold"),
-                    ("pointer", "fg:cyan bold"),
-                ]),
-            ).ask()
+                choice = questionary.select(
+                    "请选择功能:",
+                    choices=menu_items,
+                    style=questionary.Style([
+                        ("selected", "fg:cyan bold"),
+                        ("pointer", "fg:cyan bold"),
+                    ]),
+                ).ask()
             
-            if choice is None or choice == "exit":
-                console.print("\n[cyan]感谢使用 NetOps Toolkit,再见![/cyan]\n")
-                break
+                if choice is None or choice == "exit":
+                    console.print("\n[cyan]感谢使用 NetOps Toolkit,再见![/cyan]\n")
+                    break
             
-            if choice == "about":
-                show_about()
-                continue
+                if choice == "about":
+                    show_about()
+                    continue
             
-            if choice == "settings":
-                show_settings()
-                continue
+                if choice == "settings":
+                    show_settings(config)
+                    continue
             
-            # 如果是分类,显示插件菜单
-            if isinstance(choice, PluginCategory):
-                while True:
-                    plugin_menu = build_plugin_menu(choice)
+                # 如果是分类,显示插件菜单
+                if isinstance(choice, PluginCategory):
+                    while True:
+                        plugin_menu = build_plugin_menu(choice)
                     
-                    plugin_choice = questionary.select(
-                        f"选择 {choice.value} 插件:",
-                        choices=plugin_menu,
-                    ).ask()
+                        plugin_choice = questionary.select(
+                            f"选择 {choice.value} 插件:",
+                            choices=plugin_menu,
+                        ).ask()
                     
-                    if plugin_choice is None or plugin_choice == "back":
-                        break
+                        if plugin_choice is None or plugin_choice == "back":
+                            break
                     
-                    # 运行选中的插件
-                    run_plugin_interactive(plugin_choice)
+                        # 运行选中的插件
+                        run_plugin_interactive(plugin_choice)
                     
-                    # 等待用户按键继续
-                    questionary.press_any_key_to_continue(
-                        message="\n按任意键继续..."
-                    ).ask()
+                        # 等待用户按键继续
+                        questionary.press_any_key_to_continue(
+                            message="\n按任意键继续..."
+                        ).ask()
                     
-        except KeyboardInterrupt:
-            console.print("\n\n[yellow]操作已中断[/yellow]")
-            break
-        except Exception as e:
-            logger.error(f"运行错误: {e}")
-            console.print(f"\n[red]错误: {e}[/red]")
+            except KeyboardInterrupt:
+                console.print("\n\n[yellow]操作已中断[/yellow]")
+                break
+            except Exception as e:
+                logger.error(f"运行错误: {e}")
+                console.print(f"\n[red]错误: {e}[/red]")
+    finally:
+        # 会话结束时统一清理缓存的插件实例
+        cleanup_session_plugins()
 
 
 # ==================== CLI 命令 ====================
 
-@app.callback(invoke_without_command=True)
-def main(
-    ctx: typer.Context,
-    version: bool = typer.Option(False, "--version", "-v", help="显示版本号"),
-):
+# 子命令注册表: 命令名 -> 命令函数 (按需注册到 Typer)
+_lazy_commands: Dict[str, Callable] = {}
+
+
+def lazy_command(name: Optional[str] = None) -> Callable:
     """
-    NetOps Toolkit - 网络工程实施及测试工具集
+    延迟注册子命令的装饰器
     
-    无参数运行进入交互式模式,或使用子命令执行特定功能。
+    只记录命令函数, 由 register_commands() 决定注册哪些命令到 Typer。
+    
+    Args:
+        name: 命令名称 (None表示使用函数名)
     """
-    init_app()
+    def decorator(func: Callable) -> Callable:
+        _lazy_commands[name or func.__name__.replace("_", "-")] = func
+        return func
+    return decorator
+
+
+def register_commands(argv: Optional[List[str]] = None) -> None:
+    """
+    向 Typer 注册子命令
     
-    if version:
-        console.print(f"NetOps Toolkit v{__version__}")
-        raise typer.Exit()
+    命令行指定了已知子命令时只注册该命令, 避免为整棵命令树构建参数解析;
+    查看帮助、进入交互模式或命令未知时注册全部命令。
     
-    # 如果没有子命令,进入交互模式
-    if ctx.invoked_subcommand is None:
-        interactive_mode()
+    Args:
+        argv: 命令行参数 (None表示使用 sys.argv[1:])
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # 主回调只有不带值的选项, 第一个非选项参数即为子命令
+    selected = next((arg for arg in argv if not arg.startswith("-")), None)
+    names = [selected] if selected in _lazy_commands else list(_lazy_commands)
+    
+    registered = {info.name for info in app.registered_commands}
+    for name in names:
+        if name not in registered:
+            app.command(name=name)(_lazy_commands[name])
 
 
-@app.command()
-def ping(
-    targets: str = typer.Argument(..., help="目标IP或主机名 (支持逗号分隔或CIDR)"),
-    count: int = typer.Option(4, "-c", "--count", help="Ping次数"),
-    timeout: float = typer.Option(2.0, "-t", "--timeout", help="超时时间(秒)"),
-    export: Optional[str] = typer.Option(None, "-o", "--output", help="导出文件路径"),
-):
+@lru_cache(maxsize=None)
+def _load_plugin(module: str, class_name: str) -> type:
     """
-    Ping测试 - 检测网络连通性
+    导入并返回插件类 (结果缓存, 重复调用无需再走导入系统)
     
-    示例:
-        netops ping 192.168.1.1
-        netops ping 192.168.1.1,192.168.1.2 -c 10
-        netops ping 192.168.1.0/24 -o result.json
+    Args:
+        module: 插件模块路径
+        class_name: 插件类名
+        
+    Returns:
+        插件类
+    """
+    return getattr(importlib.import_module(module), class_name)
+
+
+def _dispatch(
+    module: str,
+    class_name: str,
+    label: str,
+    action: str,
+    target: str,
+    params: Dict[str, Any],
+) -> None:
+    """
+    加载并执行插件 (CLI子命令公共流程)
+    
+    依次完成插件导入、初始化、执行、审计日志记录和资源清理,
+    执行失败时以退出码 1 结束。
+    
+    Args:
+        module: 插件模块路径
+        class_name: 插件类名
+        label: 插件显示名称 (用于错误提示)
+        action: 审计日志中的操作类型
+        target: 审计日志中的操作目标
+        params: 传递给插件 run() 的参数
     """
-    # 动态导入插件
     try:
-        from netops_toolkit.plugins.diagnostics.ping import PingPlugin
-    except ImportError as e:
-        console.print(f"[red]无法加载Ping插件: {e}[/red]")
+        plugin_class = _load_plugin(module, class_name)
+    except (ImportError, AttributeError) as e:
+        console.print(f"[red]无法加载{label}插件: {e}[/red]")
         raise typer.Exit(1)
     
-    plugin = PingPlugin()
+    plugin = plugin_class()
     
     if not plugin.initialize():
         console.print("[red]插件初始化失败[/red]")
         raise typer.Exit(1)
     
     try:
-        result = plugin.run(
-            targets=targets,
-            count=count,
-            timeout=timeout,
-            export_path=export,
-        )
+        result = plugin.run(**params)
         
         log_audit(
             user="cli",
-            action="ping",
-            target=targets,
+            action=action,
+            target=target,
             result=result.status.value,
         )
         
@@ -407,7 +552,65 @@ def ping(
         plugin.cleanup()
 
 
-@app.command()
+def _version_callback(value: bool) -> None:
+    """--version 为 eager 选项: 解析阶段即输出版本并退出, 不初始化配置和日志"""
+    if value:
+        print(f"NetOps Toolkit v{__version__}")
+        raise typer.Exit()
+
+
+@app.callback(invoke_without_command=True)
+def main(
+    ctx: typer.Context,
+    version: bool = typer.Option(
+        False, "--version", "-v", help="显示版本号",
+        callback=_version_callback, is_eager=True,
+    ),
+):
+    """
+    NetOps Toolkit - 网络工程实施及测试工具集
+    
+    无参数运行进入交互式模式,或使用子命令执行特定功能。
+    """
+    # 每次调用只获取一次配置, 经 ctx.obj 传给子命令
+    config = get_config()
+    ctx.obj = config
+    init_app(config)
+    
+    # 如果没有子命令,进入交互模式
+    if ctx.invoked_subcommand is None:
+        interactive_mode(config)
+
+
+@lazy_command()
+def ping(
+    targets: str = typer.Argument(..., help="目标IP或主机名 (支持逗号分隔或CIDR)"),
+    count: int = typer.Option(4, "-c", "--count", help="Ping次数"),
+    timeout: float = typer.Option(2.0, "-t", "--timeout", help="超时时间(秒)"),
+    export: Optional[str] = typer.Option(None, "-o", "--output", help="导出文件路径"),
+):
+    """
+    Ping测试 - 检测网络连通性
+    
+    示例:
+        netops ping 192.168.1.1
+        netops ping 192.168.1.1,192.168.1.2 -c 10
+        netops ping 192.168.1.0/24 -o result.json
+    """
+    _dispatch(
+        "netops_toolkit.plugins.diagnostics.ping", "PingPlugin", "Ping",
+        action="ping",
+        target=targets,
+        params={
+            "targets": targets,
+            "count": count,
+            "timeout": timeout,
+            "export_path": export,
+        },
+    )
+
+
+@lazy_command()
 def scan(
     target: str = typer.Argument(..., help="目标IP或网段"),
     ports: str = typer.Option("1-1024", "-p", "--ports", help="端口范围"),
@@ -421,40 +624,19 @@ def scan(
         netops scan 192.168.1.1 -p 22,80,443
         netops scan 192.168.1.0/24 -p 1-1000 -T 100
     """
-    try:
-        from netops_toolkit.plugins.scanning.port_scan import PortScanPlugin
-    except ImportError as e:
-        console.print(f"[red]无法加载端口扫描插件: {e}[/red]")
-        raise typer.Exit(1)
-    
-    plugin = PortScanPlugin()
-    
-    if not plugin.initialize():
-        console.print("[red]插件初始化失败[/red]")
-        raise typer.Exit(1)
-    
-    try:
-        result = plugin.run(
-            target=target,
-            ports=ports,
-            threads=threads,
-        )
-        
-        log_audit(
-            user="cli",
-            action="port_scan",
-            target=target,
-            result=result.status.value,
-        )
-        
-        if not result.is_success:
-            raise typer.Exit(1)
-            
-    finally:
-        plugin.cleanup()
+    _dispatch(
+        "netops_toolkit.plugins.scanning.port_scan", "PortScanPlugin", "端口扫描",
+        action="port_scan",
+        target=target,
+        params={
+            "target": target,
+            "ports": ports,
+            "threads": threads,
+        },
+    )
 
 
-@app.command()
+@lazy_command()
 def dns(
     domain: str = typer.Argument(..., help="域名或IP地址"),
     record_type: str = typer.Option("A", "-t", "--type", help="记录类型 (A, AAAA, MX, CNAME, NS, TXT)"),
@@ -468,40 +650,19 @@ def dns(
         netops dns baidu.com -t MX
         netops dns 8.8.8.8
     """
-    try:
-        from netops_toolkit.plugins.diagnostics.dns_lookup import DNSLookupPlugin
-    except ImportError as e:
-        console.print(f"[red]无法加载DNS查询插件: {e}[/red]")
-        raise typer.Exit(1)
-    
-    plugin = DNSLookupPlugin()
-    
-    if not plugin.initialize():
-        console.print("[red]插件初始化失败[/red]")
-        raise typer.Exit(1)
-    
-    try:
-        result = plugin.run(
-            domain=domain,
-            record_type=record_type,
-            dns_server=server,
-        )
-        
-        log_audit(
-            user="cli",
-            action="dns_lookup",
-            target=domain,
-            result=result.status.value,
-        )
-        
-        if not result.is_success:
-            raise typer.Exit(1)
-            
-    finally:
-        plugin.cleanup()
+    _dispatch(
+        "netops_toolkit.plugins.diagnostics.dns_lookup", "DNSLookupPlugin", "DNS查询",
+        action="dns_lookup",
+        target=domain,
+        params={
+            "domain": domain,
+            "record_type": record_type,
+            "dns_server": server,
+        },
+    )
 
 
-@app.command(name="ssh-batch")
+@lazy_command(name="ssh-batch")
 def ssh_batch(
     targets: Optional[List[str]] = typer.Option(None, "-t", "--target", help="目标设备IP列表"),
     group: Optional[str] = typer.Option(None, "-g", "--group", help="设备组名称"),
@@ -520,55 +681,42 @@ def ssh_batch(
         netops ssh-batch -t 192.168.1.1 -t 192.168.1.2 -c "show version" -u admin -p password
         netops ssh-batch -g core_switches -c "show ip int brief" -c "show running-config"
     """
-    try:
-        from netops_toolkit.plugins.device_mgmt.ssh_batch import SSHBatchPlugin
-    except ImportError as e:
-        console.print(f"[red]无法加载SSH批量执行插件: {e}[/red]")
-        raise typer.Exit(1)
-    
     if not targets and not group:
         console.print("[red]请指定设备 (-t) 或设备组 (-g)[/red]")
         raise typer.Exit(1)
     
-    plugin = SSHBatchPlugin()
-    
-    if not plugin.initialize():
-        console.print("[red]插件初始化失败[/red]")
-        raise typer.Exit(1)
+    params = {
+        "commands": commands,
+        "username": username,
+        "password": password,
+        "device_type": device_type,
+        "max_workers": max_workers,
+        "timeout": timeout,
+        "config_mode": config_mode,
+    }
     
-    try:
-        params = {
-            "commands": commands,
-            "username": username,
-            "password": password,
-            "device_type": device_type,
-            "max_workers": max_workers,
-            "timeout": timeout,
-            "config_mode": config_mode,
-        }
-        
-        if targets:
-            params["targets"] = targets
-        if group:
-            params["group"] = group
-        
-        result = plugin.run(params)
-        
-        log_audit(
-            user="cli",
-            action="ssh_batch",
-            target=group or ",".join(targets) if targets else "unknown",
-            result=result.status.value,
-        )
-        
-        if not result.is_success:
-            raise typer.Exit(1)
-            
-    finally:
-        plugin.cleanup()
+    if targets:
+        params["targets"] = targets
+    if group:
+        params["group"] = group
+    
+    # 审计目标: 优先记录设备组, 否则记录设备列表
+    if group:
+        audit_target = group
+    elif targets:
+        audit_target = ",".join(targets)
+    else:
+        audit_target = "unknown"
+    
+    _dispatch(
+        "netops_toolkit.plugins.device_mgmt.ssh_batch", "SSHBatchPlugin", "SSH批量执行",
+        action="ssh_batch",
+        target=audit_target,
+        params=params,
+    )
 
 
-@app.command(name="config-backup")
+@lazy_command(name="config-backup")
 def config_backup(
     targets: Optional[List[str]] = typer.Option(None, "-t", "--target", help="目标设备IP列表"),
     group: Optional[str] = typer.Option(None, "-g", "--group", help="设备组名称"),
@@ -586,54 +734,41 @@ def config_backup(
         netops config-backup -t 192.168.1.1 -u admin -p password
         netops config-backup -g core_switches -d ./backups/core
     """
-    try:
-        from netops_toolkit.plugins.device_mgmt.config_backup import ConfigBackupPlugin
-    except ImportError as e:
-        console.print(f"[red]无法加载配置备份插件: {e}[/red]")
-        raise typer.Exit(1)
-    
     if not targets and not group:
         console.print("[red]请指定设备 (-t) 或设备组 (-g)[/red]")
         raise typer.Exit(1)
     
-    plugin = ConfigBackupPlugin()
-    
-    if not plugin.initialize():
-        console.print("[red]插件初始化失败[/red]")
-        raise typer.Exit(1)
+    params = {
+        "username": username,
+        "password": password,
+        "device_type": device_type,
+        "backup_dir": backup_dir,
+        "max_workers": max_workers,
+        "timeout": timeout,
+    }
     
-    try:
-        params = {
-            "username": username,
-            "password": password,
-            "device_type": device_type,
-            "backup_dir": backup_dir,
-            "max_workers": max_workers,
-            "timeout": timeout,
-        }
-        
-        if targets:
-            params["targets"] = targets
-        if group:
-            params["group"] = group
-        
-        result = plugin.run(params)
-        
-        log_audit(
-            user="cli",
-            action="config_backup",
-            target=group or ",".join(targets) if targets else "unknown",
-            result=result.status.value,
-        )
-        
-        if not result.is_success:
-            raise typer.Exit(1)
-            
-    finally:
-        plugin.cleanup()
+    if targets:
+        params["targets"] = targets
+    if group:
+        params["group"] = group
+    
+    # 审计目标: 优先记录设备组, 否则记录设备列表
+    if group:
+        audit_target = group
+    elif targets:
+        audit_target = ",".join(targets)
+    else:
+        audit_target = "unknown"
+    
+    _dispatch(
+        "netops_toolkit.plugins.device_mgmt.config_backup", "ConfigBackupPlugin", "配置备份",
+        action="config_backup",
+        target=audit_target,
+        params=params,
+    )
 
 
-@app.command()
+@lazy_command()
 def traceroute(
     target: str = typer.Argument(..., help="目标IP或主机名"),
     max_hops: int = typer.Option(30, "-m", "--max-hops", help="最大跳数"),
@@ -647,41 +782,20 @@ def traceroute(
         netops traceroute www.baidu.com
         netops traceroute 8.8.8.8 -m 15
     """
-    try:
-        from netops_toolkit.plugins.diagnostics.traceroute import TraceroutePlugin
-    except ImportError as e:
-        console.print(f"[red]无法加载Traceroute插件: {e}[/red]")
-        raise typer.Exit(1)
-    
-    plugin = TraceroutePlugin()
-    
-    if not plugin.initialize():
-        console.print("[red]插件初始化失败[/red]")
-        raise typer.Exit(1)
-    
-    try:
-        result = plugin.run(
-            target=target,
-            max_hops=max_hops,
-            timeout=timeout,
-            export_path=export,
-        )
-        
-        log_audit(
-            user="cli",
-            action="traceroute",
-            target=target,
-            result=result.status.value,
-        )
-        
-        if not result.is_success:
-            raise typer.Exit(1)
-            
-    finally:
-        plugin.cleanup()
+    _dispatch(
+        "netops_toolkit.plugins.diagnostics.traceroute", "TraceroutePlugin", "Traceroute",
+        action="traceroute",
+        target=target,
+        params={
+            "target": target,
+            "max_hops": max_hops,
+            "timeout": timeout,
+            "export_path": export,
+        },
+    )
 
 
-@app.command()
+@lazy_command()
 def http(
     url: str = typer.Argument(..., help="目标URL"),
     method: str = typer.Option("GET", "-m", "--method", help="HTTP方法"),
@@ -695,41 +809,20 @@ def http(
         netops http https://www.baidu.com
         netops http https://api.github.com -m POST
     """
-    try:
-        from netops_toolkit.plugins.utils.http_debug import HTTPDebugPlugin
-    except ImportError as e:
-        console.print(f"[red]无法加载HTTP调试插件: {e}[/red]")
-        raise typer.Exit(1)
-    
-    plugin = HTTPDebugPlugin()
-    
-    if not plugin.initialize():
-        console.print("[red]插件初始化失败[/red]")
-        raise typer.Exit(1)
-    
-    try:
-        result = plugin.run(
-            url=url,
-            method=method,
-            timeout=timeout,
-            export_path=export,
-        )
-        
-        log_audit(
-            user="cli",
-            action="http_debug",
-            target=url,
-            result=result.status.value,
-        )
-        
-        if not result.is_success:
-            raise typer.Exit(1)
-            
-    finally:
-        plugin.cleanup()
+    _dispatch(
+        "netops_toolkit.plugins.utils.http_debug", "HTTPDebugPlugin", "HTTP调试",
+        action="http_debug",
+        target=url,
+        params={
+            "url": url,
+            "method": method,
+            "timeout": timeout,
+            "export_path": export,
+        },
+    )
 
 
-@app.command()
+@lazy_command()
 def subnet(
     cidr: str = typer.Argument(..., help="CIDR格式的网络地址 (e.g., 192.168.1.0/24)"),
 ):
@@ -740,6 +833,7 @@ def subnet(
         netops subnet 192.168.1.0/24
         netops subnet 10.0.0.0/8
     """
+    from netops_toolkit.ui.components import create_summary_panel
     from netops_toolkit.utils.network_utils import get_network_info, is_valid_network
     
     if not is_valid_network(cidr):
@@ -762,7 +856,7 @@ def subnet(
         console.print(panel)
 
 
-@app.command(name="quality")
+@lazy_command(name="quality")
 def network_quality(
     target: str = typer.Argument(..., help="目标IP或主机名"),
     count: int = typer.Option(50, "-c", "--count", help="测试次数"),
@@ -777,41 +871,21 @@ def network_quality(
         netops quality www.baidu.com -c 100
         netops quality 192.168.1.1 -c 30 -i 0.5
     """
-    try:
-        from netops_toolkit.plugins.performance.network_quality import NetworkQualityPlugin
-    except ImportError as e:
-        console.print(f"[red]无法加载网络质量测试插件: {e}[/red]")
-        raise typer.Exit(1)
-    
-    plugin = NetworkQualityPlugin()
-    
-    if not plugin.initialize():
-        console.print("[red]插件初始化失败[/red]")
-        raise typer.Exit(1)
-    
-    try:
-        result = plugin.run({
+    _dispatch(
+        "netops_toolkit.plugins.performance.network_quality",
+        "NetworkQualityPlugin", "网络质量测试",
+        action="network_quality",
+        target=target,
+        params={
             "target": target,
             "count": count,
             "interval": interval,
             "timeout": timeout,
-        })
-        
-        log_audit(
-            user="cli",
-            action="network_quality",
-            target=target,
-            result=result.status.value,
-        )
-        
-        if not result.is_success:
-            raise typer.Exit(1)
-            
-    finally:
-        plugin.cleanup()
+        },
+    )
 
 
-@app.command(name="speedtest")
+@lazy_command(name="speedtest")
 def bandwidth_test(
     server_id: Optional[str] = typer.Option(None, "-s", "--server", help="测速服务器ID"),
     timeout: int = typer.Option(60, "-t", "--timeout", help="超时时间(秒)"),
@@ -825,40 +899,19 @@ def bandwidth_test(
         netops speedtest --simple
         netops speedtest -s 12345
     """
-    try:
-        from netops_toolkit.plugins.performance.bandwidth_test import BandwidthTestPlugin
-    except ImportError as e:
-        console.print(f"[red]无法加载带宽测速插件: {e}[/red]")
-        raise typer.Exit(1)
-    
-    plugin = BandwidthTestPlugin()
-    
-    if not plugin.initialize():
-        console.print("[red]插件初始化失败[/red]")
-        raise typer.Exit(1)
-    
-    try:
-        result = plugin.run({
+    _dispatch(
+        "netops_toolkit.plugins.performance.bandwidth_test", "BandwidthTestPlugin", "带宽测速",
+        action="bandwidth_test",
+        target="speedtest",
+        params={
             "server_id": server_id,
             "timeout": timeout,
             "simple": simple,
-        })
-        
-        log_audit(
-            user="cli",
-            action="bandwidth_test",
-            target="speedtest",
-            result=result.status.value,
-        )
-        
-        if not result.is_success:
-            raise typer.Exit(1)
-            
-    finally:
-        plugin.cleanup()
+        },
+    )
 
 
-@app.command(name="ip-convert")
+@lazy_command(name="ip-convert")
 def ip_convert(
     ip: str = typer.Argument(..., help="IP地址(支持多种格式)"),
 ):
@@ -870,36 +923,15 @@ def ip_convert(
         netops ip-convert 3232235777
         netops ip-convert 0xC0A80101
     """
-    try:
-        from netops_toolkit.plugins.utils.ip_converter import IPConverterPlugin
-    except ImportError as e:
-        console.print(f"[red]无法加载IP转换插件: {e}[/red]")
-        raise typer.Exit(1)
-    
-    plugin = IPConverterPlugin()
-    
-    if not plugin.initialize():
-        console.print("[red]插件初始化失败[/red]")
-        raise typer.Exit(1)
-    
-    try:
-        result = plugin.run({"ip": ip})
-        
-        log_audit(
-            user="cli",
-            action="ip_convert",
-            target=ip,
-            result=result.status.value,
-        )
-        
-        if not result.is_success:
-            raise typer.Exit(1)
-            
-    finally:
-        plugin.cleanup()
+    _dispatch(
+        "netops_toolkit.plugins.utils.ip_converter", "IPConverterPlugin", "IP转换",
+        action="ip_convert",
+        target=ip,
+        params={"ip": ip},
+    )
 
 
-@app.command(name="mac-lookup")
+@lazy_command(name="mac-lookup")
 def mac_lookup(
     mac: str = typer.Argument(..., help="MAC地址"),
 ):
@@ -911,36 +943,15 @@ def mac_lookup(
         netops mac-lookup 00-0C-29-12-34-56
         netops mac-lookup 000C29123456
     """
-    try:
-        from netops_toolkit.plugins.utils.mac_lookup import MACLookupPlugin
-    except ImportError as e:
-        console.print(f"[red]无法加载MAC查询插件: {e}[/red]")
-        raise typer.Exit(1)
-    
-    plugin = MACLookupPlugin()
-    
-    if not plugin.initialize():
-        console.print("[red]插件初始化失败[/red]")
-        raise typer.Exit(1)
-    
-    try:
-        result = plugin.run({"mac": mac})
-        
-        log_audit(
-            user="cli",
-            action="mac_lookup",
-            target=mac,
-            result=result.status.value,
-        )
-        
-        if not result.is_success:
-            raise typer.Exit(1)
-            
-    finally:
-        plugin.cleanup()
+    _dispatch(
+        "netops_toolkit.plugins.utils.mac_lookup", "MACLookupPlugin", "MAC查询",
+        action="mac_lookup",
+        target=mac,
+        params={"mac": mac},
+    )
 
 
-@app.command(name="arp-scan")
+@lazy_command(name="arp-scan")
 def arp_scan(
     network: str = typer.Argument(..., help="网络地址(CIDR格式)"),
     timeout: int = typer.Option(1, "-t", "--timeout", help="超时时间(秒)"),
@@ -953,40 +964,19 @@ def arp_scan(
         netops arp-scan 192.168.1.0/24
         netops arp-scan 10.0.0.0/24 -w 100
     """
-    try:
-        from netops_toolkit.plugins.scanning.arp_scan import ARPScanPlugin
-    except ImportError as e:
-        console.print(f"[red]无法加载ARP扫描插件: {e}[/red]")
-        raise typer.Exit(1)
-    
-    plugin = ARPScanPlugin()
-    
-    if not plugin.initialize():
-        console.print("[red]插件初始化失败[/red]")
-        raise typer.Exit(1)
-    
-    try:
-        result = plugin.run({
+    _dispatch(
+        "netops_toolkit.plugins.scanning.arp_scan", "ARPScanPlugin", "ARP扫描",
+        action="arp_scan",
+        target=network,
+        params={
             "network": network,
             "timeout": timeout,
             "max_workers": workers,
-        })
-        
-        log_audit(
-            user="cli",
-            action="arp_scan",
-            target=network,
-            result=result.status.value,
-        )
-        
-        if not result.is_success:
-            raise typer.Exit(1)
-            
-    finally:
-        plugin.cleanup()
+        },
+    )
 
 
-@app.command(name="config-diff")
+@lazy_command(name="config-diff")
 def config_diff(
     file1: str = typer.Argument(..., help="第一个配置文件"),
     file2: str = typer.Argument(..., help="第二个配置文件"),
@@ -1001,42 +991,21 @@ def config_diff(
         netops config-diff config1.txt config2.txt
         netops config-diff old.cfg new.cfg --ignore-ws
     """
-    try:
-        from netops_toolkit.plugins.device_mgmt.config_diff import ConfigDiffPlugin
-    except ImportError as e:
-        console.print(f"[red]无法加载配置对比插件: {e}[/red]")
-        raise typer.Exit(1)
-    
-    plugin = ConfigDiffPlugin()
-    
-    if not plugin.initialize():
-        console.print("[red]插件初始化失败[/red]")
-        raise typer.Exit(1)
-    
-    try:
-        result = plugin.run({
+    _dispatch(
+        "netops_toolkit.plugins.device_mgmt.config_diff", "ConfigDiffPlugin", "配置对比",
+        action="config_diff",
+        target=f"{file1} <-> {file2}",
+        params={
             "file1": file1,
             "file2": file2,
             "context_lines": context,
             "ignore_whitespace": ignore_whitespace,
             "ignore_comments": ignore_comments,
-        })
-        
-        log_audit(
-            user="cli",
-            action="config_diff",
-            target=f"{file1} <-> {file2}",
-            result=result.status.value,
-        )
-        
-        if not result.is_success:
-            raise typer.Exit(1)
-            
-    finally:
-        plugin.cleanup()
+        },
+    )
 
 
-@app.command(name="whois")
+@lazy_command(name="whois")
 def whois_query(
     target: str = typer.Argument(..., help="域名或IP地址"),
     timeout: int = typer.Option(30, "-t", "--timeout", help="查询超时(秒)"),
@@ -1048,37 +1017,17 @@ def whois_query(
         netops whois baidu.com
         netops whois 8.8.8.8
     """
-    try:
-        from netops_toolkit.plugins.utils.whois_lookup import WhoisLookupPlugin
-    except ImportError as e:
-        console.print(f"[red]无法加载WHOIS查询插件: {e}[/red]")
-        raise typer.Exit(1)
-    
-    plugin = WhoisLookupPlugin()
-    
-    if not plugin.initialize():
-        console.print("[red]插件初始化失败[/red]")
-        raise typer.Exit(1)
-    
-    try:
-        result = plugin.run({
+    _dispatch(
+        "netops_toolkit.plugins.utils.whois_lookup", "WhoisLookupPlugin", "WHOIS查询",
+        action="whois",
+        target=target,
+        params={
             "target": target,
             "timeout": timeout,
-        })
-        
-        log_audit(
-            user="cli",
-            action="whois",
-            target=target,
-            result=result.status.value,
-        )
-        
-        if not result.is_success:
-            raise typer.Exit(1)
-            
-    finally:
-        plugin.cleanup()
+        },
+    )
 
 
 if __name__ == "__main__":
+    register_commands()
     app()
@@ -5,11 +5,12 @@
 """
 
 import os
+import sys
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-import yaml
+from typing import Any, Dict, Iterator, Optional, Tuple
 
+from netops_toolkit.config.yaml_loader import load_yaml, scan_dir
 from netops_toolkit.core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -30,11 +31,52 @@ class ConfigManager:
             config_dir: 配置文件目录路径 (None表示使用默认路径)
         """
         self.config_dir = Path(config_dir) if config_dir else self.DEFAULT_CONFIG_DIR
+        # 默认配置文件路径 (只计算一次)
+        self._settings_path = self.config_dir / self.DEFAULT_SETTINGS_FILE
+        self._devices_path = self.config_dir / self.DEFAULT_DEVICES_FILE
         self._settings: Optional[Dict[str, Any]] = None
         self._devices: Optional[Dict[str, Any]] = None
+        # 扁平化配置: 点号键 -> 值 (包含中间层级, 加载配置时重建)
+        self._flat: Dict[str, Any] = {}
+        # 配置目录的文件元数据 (仅在 load_all() 期间有效)
+        self._dir_index: Optional[Dict[str, os.stat_result]] = None
         
         logger.info(f"配置管理器已初始化 | 配置目录: {self.config_dir}")
     
+    def load_all(self) -> None:
+        """
+        加载全局配置和设备清单
+        
+        只遍历一次配置目录, 两次加载共用得到的文件元数据。
+        """
+        self._dir_index = scan_dir(self.config_dir)
+        try:
+            self.load_settings()
+            self.load_devices()
+        finally:
+            self._dir_index = None
+    
+    def _config_file(
+        self,
+        file_name: Optional[str],
+        default_path: Path,
+    ) -> Tuple[Path, Optional[Dict[str, os.stat_result]]]:
+        """获取配置文件路径 (None表示默认文件), 以及可用于该文件的目录索引"""
+        index = self._dir_index
+        if file_name is None:
+            return default_path, index
+        
+        config_path = self.config_dir / file_name
+        if index is not None and config_path.parent != self.config_dir:
+            index = None
+        return config_path, index
+    
+    def _file_exists(self, config_path: Path, index: Optional[Dict[str, Any]]) -> bool:
+        """检查配置文件是否存在 (优先查目录索引)"""
+        if index is not None:
+            return config_path.name in index
+        return config_path.exists()
+    
     def load_settings(self, file_name: Optional[str] = None) -> Dict[str, Any]:
         """
         加载全局配置
@@ -45,23 +87,39 @@ class ConfigManager:
         Returns:
             配置字典
         """
-        if file_name is None:
-            file_name = self.DEFAULT_SETTINGS_FILE
+        config_path, index = self._config_file(file_name, self._settings_path)
         
-        config_path = self.config_dir / file_name
-        
-        if not config_path.exists():
+        if not self._file_exists(config_path, index):
             logger.warning(f"配置文件不存在: {config_path}, 使用默认配置")
-            return self._get_default_settings()
+            return self._set_settings(self._get_default_settings())
         
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                self._settings = yaml.safe_load(f) or {}
+            settings = self._set_settings(load_yaml(config_path, index) or {})
             logger.info(f"配置文件已加载: {config_path}")
-            return self._settings
+            return settings
         except Exception as e:
             logger.error(f"加载配置文件失败: {e}")
-            return self._get_default_settings()
+            return self._set_settings(self._get_default_settings())
+    
+    def _set_settings(self, settings: Dict[str, Any]) -> Dict[str, Any]:
+        """保存配置并重建扁平化索引"""
+        self._settings = settings
+        self._flat = dict(self._flatten(settings))
+        return settings
+    
+    @classmethod
+    def _flatten(cls, data: Any, prefix: str = "") -> Iterator[Tuple[str, Any]]:
+        """
+        逐层展开嵌套字典, 生成 (点号键, 值), 中间层级的字典同样保留
+        
+        点号键经过驻留, 以驻留字符串查询时可直接按对象相等命中。
+        """
+        if not isinstance(data, dict):
+            return
+        for k, v in data.items():
+            key = sys.intern(f"{prefix}{k}")
+            yield key, v
+            yield from cls._flatten(v, f"{key}.")
     
     def load_devices(self, file_name: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -73,18 +131,14 @@ class ConfigManager:
         Returns:
             设备清单字典
         """
-        if file_name is None:
-            file_name = self.DEFAULT_DEVICES_FILE
-        
-        config_path = self.config_dir / file_name
+        config_path, index = self._config_file(file_name, self._devices_path)
         
-        if not config_path.exists():
+        if not self._file_exists(config_path, index):
             logger.warning(f"设备清单文件不存在: {config_path}")
             return {"groups": {}, "standalone_devices": []}
         
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                self._devices = yaml.safe_load(f) or {}
+            self._devices = load_yaml(config_path, index) or {}
             logger.info(f"设备清单已加载: {config_path}")
             return self._devices
         except Exception as e:
@@ -105,16 +159,7 @@ class ConfigManager:
         if self._settings is None:
             self.load_settings()
         
-        keys = key.split(".")
-        value = self._settings
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
+        return self._flat.get(key, default)
     
     def _get_default_settings(self) -> Dict[str, Any]:
         """获取默认配置"""
@@ -157,6 +202,8 @@ class ConfigManager:
 
 # 全局配置实例 (单例)
 _config_instance: Optional[ConfigManager] = None
+# 仅在首次创建实例时使用的锁
+_config_lock = threading.Lock()
 
 
 def get_config() -> ConfigManager:
@@ -168,12 +215,19 @@ def get_config() -> ConfigManager:
     """
     global _config_instance
     
-    if _config_instance is None:
-        _config_instance = ConfigManager()
-        _config_instance.load_settings()
-        _config_instance.load_devices()
+    # 快速路径: 已初始化时无需加锁
+    instance = _config_instance
+    if instance is not None:
+        return instance
     
-    return _config_instance
+    # 双重检查锁定: 多线程同时首次调用时只加载一次配置,
+    # 实例完全加载后才赋给全局变量
+    with _config_lock:
+        if _config_instance is None:
+            instance = ConfigManager()
+            instance.load_all()
+            _config_instance = instance
+        return _config_instance
 
 
 __all__ = ["ConfigManager", "get_config"]
@@ -4,50 +4,119 @@
 负责加载、解析、查询设备清单信息。
 """
 
+import sys
+from collections import defaultdict
 from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-import yaml
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
+from netops_toolkit.config.yaml_loader import load_yaml
 from netops_toolkit.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Python 3.10+ 的 dataclass 支持 slots, 旧版本退化为普通实例
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+def _intern(value: Any) -> Any:
+    """驻留字符串 (厂商、凭据、标签等大量重复的取值共用同一对象), 非字符串原样返回"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern_tags(tags: Any) -> Tuple[str, ...]:
+    """将标签列表转换为驻留字符串元组 (空值视为无标签, 单个字符串视为一个标签)"""
+    if tags is None:
+        return ()
+    if isinstance(tags, str):
+        return (_intern(tags),)
+    return tuple(_intern(t) for t in tags)
+
+
+# Device 导出字段 (顺序即 to_dict() 的键顺序), 一次 attrgetter 调用取出全部字段
+_DEVICE_FIELDS = (
+    "name", "ip", "port", "vendor", "credentials", "description", "tags", "group", "extra",
+)
+_device_attrs = attrgetter(*_DEVICE_FIELDS)
+
+
+def _device_record(values: Tuple[Any, ...]) -> Dict[str, Any]:
+    """将字段值元组转换为导出字典 (tags 转为列表, extra 为空时输出空字典)"""
+    record = dict(zip(_DEVICE_FIELDS, values))
+    record["tags"] = list(record["tags"])
+    extra = record["extra"]
+    record["extra"] = dict(extra) if extra else {}
+    return record
+
+
+def _check_device(name: Any, ip: Any) -> None:
+    """验证设备必填字段"""
+    if not name:
+        raise ValueError("设备名称不能为空")
+    if not ip:
+        raise ValueError("设备IP不能为空")
+
+
+# 设备定义中的保留字段, 其余字段归入 Device.extra
+_RESERVED_DEV_KEYS = frozenset((
+    "name", "ip", "port", "vendor", "credentials", "description", "tags",
+))
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Device:
-    """设备数据类"""
+    """
+    设备数据类 (不可变)
+    
+    没有附加字段时 extra 为 None, 不为每台设备分配空字典。
+    """
     name: str
     ip: str
     port: int = 22
     vendor: str = "cisco_ios"
     credentials: str = ""
     description: str = ""
-    tags: List[str] = field(default_factory=list)
+    tags: Tuple[str, ...] = ()
     group: str = ""
-    extra: Dict[str, Any] = field(default_factory=dict)
+    extra: Optional[Mapping[str, Any]] = field(default=None, hash=False)
     
     def __post_init__(self):
         """验证设备数据"""
-        if not self.name:
-            raise ValueError("设备名称不能为空")
-        if not self.ip:
-            raise ValueError("设备IP不能为空")
+        _check_device(self.name, self.ip)
+        if not isinstance(self.tags, tuple):
+            # 传入列表等可变序列时转为元组, 保证实例可哈希
+            object.__setattr__(self, "tags", tuple(self.tags))
+    
+    @classmethod
+    def _unsafe(
+        cls,
+        name: str,
+        ip: str,
+        port: int,
+        vendor: str,
+        credentials: str,
+        description: str,
+        tags: Tuple[str, ...],
+        group: str,
+        extra: Optional[Mapping[str, Any]] = None,
+    ) -> "Device":
+        """
+        跳过 __init__/__post_init__ 直接构建设备 (仅供清单解析使用)
+        
+        调用方须先通过 _check_device() 完成验证。
+        """
+        self = object.__new__(cls)
+        for attr, value in zip(
+            _DEVICE_FIELDS,
+            (name, ip, port, vendor, credentials, description, tags, group, extra),
+        ):
+            object.__setattr__(self, attr, value)
+        return self
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
-        return {
-            "name": self.name,
-            "ip": self.ip,
-            "port": self.port,
-            "vendor": self.vendor,
-            "credentials": self.credentials,
-            "description": self.description,
-            "tags": self.tags,
-            "group": self.group,
-            "extra": self.extra,
-        }
+        return _device_record(_device_attrs(self))
     
     def get_netmiko_params(self) -> Dict[str, Any]:
         """
@@ -95,6 +164,10 @@ class DeviceInventory:
         self._groups: Dict[str, DeviceGroup] = {}
         self._standalone_devices: List[Device] = []
         self._all_devices: Dict[str, Device] = {}
+        # IP/标签/厂商 -> 设备索引 (解析时构建, 查询 O(1))
+        self._by_ip: Dict[str, Device] = {}
+        self._tag_index: Dict[str, List[Device]] = defaultdict(list)
+        self._vendor_index: Dict[str, List[Device]] = defaultdict(list)
         
         if config_path:
             self.load(config_path)
@@ -111,19 +184,18 @@ class DeviceInventory:
             return
         
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+            data = load_yaml(config_path) or {}
         except Exception as e:
             logger.error(f"加载设备清单失败: {e}")
             return
         
         # 解析设备组
-        groups_data = data.get("groups", {})
+        groups_data = data.get("groups") or {}
         for group_name, group_info in groups_data.items():
             self._parse_group(group_name, group_info)
         
         # 解析独立设备
-        standalone_data = data.get("standalone_devices", [])
+        standalone_data = data.get("standalone_devices") or []
         for device_info in standalone_data:
             self._parse_standalone_device(device_info)
         
@@ -134,8 +206,9 @@ class DeviceInventory:
     
     def _parse_group(self, group_name: str, group_info: Dict[str, Any]) -> None:
         """解析设备组"""
-        vendor = group_info.get("vendor", "cisco_ios")
-        credentials = group_info.get("credentials", "")
+        group_name = _intern(group_name)
+        vendor = _intern(group_info.get("vendor", "cisco_ios"))
+        credentials = _intern(group_info.get("credentials", ""))
         description = group_info.get("description", "")
         
         group = DeviceGroup(
@@ -147,38 +220,73 @@ class DeviceInventory:
         
         devices_data = group_info.get("devices", [])
         for dev_info in devices_data:
-            device = Device(
-                name=dev_info.get("name", ""),
-                ip=dev_info.get("ip", ""),
+            # 只有保留字段时不构建 extra
+            extra = None
+            if not dev_info.keys() <= _RESERVED_DEV_KEYS:
+                extra = {k: v for k, v in dev_info.items() if k not in _RESERVED_DEV_KEYS}
+            name = dev_info.get("name", "")
+            ip = dev_info.get("ip", "")
+            _check_device(name, ip)
+            device = Device._unsafe(
+                name=name,
+                ip=ip,
                 port=dev_info.get("port", 22),
-                vendor=dev_info.get("vendor", vendor),
-                credentials=dev_info.get("credentials", credentials),
+                vendor=_intern(dev_info.get("vendor", vendor)),
+                credentials=_intern(dev_info.get("credentials", credentials)),
                 description=dev_info.get("description", ""),
-                tags=dev_info.get("tags", []),
+                tags=_intern_tags(dev_info.get("tags", ())),
                 group=group_name,
-                extra={k: v for k, v in dev_info.items() 
-                       if k not in ["name", "ip", "port", "vendor", 
-                                   "credentials", "description", "tags"]},
+                extra=extra,
             )
             group.devices.append(device)
-            self._all_devices[device.name] = device
+            self._add_device(device)
         
         self._groups[group_name] = group
     
     def _parse_standalone_device(self, dev_info: Dict[str, Any]) -> None:
         """解析独立设备"""
-        device = Device(
-            name=dev_info.get("name", ""),
-            ip=dev_info.get("ip", ""),
+        name = dev_info.get("name", "")
+        ip = dev_info.get("ip", "")
+        _check_device(name, ip)
+        device = Device._unsafe(
+            name=name,
+            ip=ip,
             port=dev_info.get("port", 22),
-            vendor=dev_info.get("vendor", "cisco_ios"),
-            credentials=dev_info.get("credentials", ""),
+            vendor=_intern(dev_info.get("vendor", "cisco_ios")),
+            credentials=_intern(dev_info.get("credentials", "")),
             description=dev_info.get("description", ""),
-            tags=dev_info.get("tags", []),
+            tags=_intern_tags(dev_info.get("tags", ())),
             group="",
         )
         self._standalone_devices.append(device)
+        self._add_device(device)
+    
+    def _add_device(self, device: Device) -> None:
+        """登记设备并更新索引"""
+        previous = self._all_devices.get(device.name)
+        if previous is not None:
+            # 同名设备被覆盖时, 从索引中移除旧设备
+            self._remove_from_indexes(previous)
+        
         self._all_devices[device.name] = device
+        # 同一IP出现多次时保留最先登记的设备
+        self._by_ip.setdefault(device.ip, device)
+        for tag in set(device.tags):
+            self._tag_index[tag].append(device)
+        self._vendor_index[device.vendor].append(device)
+    
+    def _remove_from_indexes(self, device: Device) -> None:
+        """从索引中移除设备"""
+        if self._by_ip.get(device.ip) is device:
+            del self._by_ip[device.ip]
+            # 回退到同IP的其他设备 (如有)
+            for other in self._all_devices.values():
+                if other is not device and other.ip == device.ip:
+                    self._by_ip[device.ip] = other
+                    break
+        for tag in set(device.tags):
+            self._tag_index[tag].remove(device)
+        self._vendor_index[device.vendor].remove(device)
     
     def get_device(self, name: str) -> Optional[Device]:
         """
@@ -202,10 +310,7 @@ class DeviceInventory:
         Returns:
             Device对象或None
         """
-        for device in self._all_devices.values():
-            if device.ip == ip:
-                return device
-        return None
+        return self._by_ip.get(ip)
     
     def get_group(self, name: str) -> Optional[DeviceGroup]:
         """
@@ -244,7 +349,7 @@ class DeviceInventory:
         Returns:
             设备列表
         """
-        return [d for d in self._all_devices.values() if tag in d.tags]
+        return list(self._tag_index.get(tag, ()))
     
     def get_devices_by_vendor(self, vendor: str) -> List[Device]:
         """
@@ -256,12 +361,24 @@ class DeviceInventory:
         Returns:
             设备列表
         """
-        return [d for d in self._all_devices.values() if d.vendor == vendor]
+        return list(self._vendor_index.get(vendor, ()))
     
     def get_all_devices(self) -> List[Device]:
         """获取所有设备"""
         return list(self._all_devices.values())
     
+    def dump_all(self) -> List[Dict[str, Any]]:
+        """
+        导出所有设备为字典列表 (与逐个调用 Device.to_dict() 结果相同)
+        
+        Returns:
+            设备字典列表
+        """
+        return [
+            _device_record(values)
+            for values in map(_device_attrs, self._all_devices.values())
+        ]
+    
     def get_all_groups(self) -> List[str]:
         """获取所有组名称"""
         return list(self._groups.keys())
@@ -0,0 +1,227 @@
+"""
+YAML加载模块
+
+为配置文件提供带缓存的YAML加载:
+- 同名 JSON 文件 (settings.yaml -> settings.json) 存在且不旧于YAML时, 直接按JSON解析
+- 否则解析结果以 marshal 格式缓存在当前用户私有的缓存目录
+  ($XDG_CACHE_HOME/netops_toolkit/yaml/, 权限 0700), 源文件未变化时直接读取, 跳过YAML解析
+
+缓存只保存纯数据, 且从不在配置目录中读写, 配置目录中放置的文件无法借缓存执行代码。
+
+YAML 仍是编写配置的格式, JSON 文件只作为可选的生成产物。
+"""
+
+import hashlib
+import json
+import marshal
+import os
+from functools import lru_cache
+from pathlib import Path
+from stat import S_ISDIR
+from typing import Any, Dict, Mapping, Optional, Union
+
+import yaml
+
+from netops_toolkit.core.logger import get_logger
+
+# 优先使用 libyaml 实现的C解析器, 未编译 libyaml 时回退到纯Python实现
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# 可选: msgspec 的JSON解码比标准库更快
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+# 缓存文件后缀与格式版本 (格式变化时递增, 旧缓存自动失效)
+CACHE_SUFFIX = ".marshal"
+CACHE_VERSION = 1
+
+
+@lru_cache(maxsize=1)
+def _cache_dir() -> Optional[Path]:
+    """
+    获取当前用户私有的YAML解析缓存目录
+
+    Returns:
+        缓存目录, 无法确定主目录、无法创建或目录不属于当前用户/权限过宽时返回 None
+    """
+    try:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    except RuntimeError:
+        # 未设置 HOME 且没有 passwd 条目
+        return None
+    directory = base / "netops_toolkit" / "yaml"
+    try:
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = os.lstat(directory)
+    except OSError as e:
+        logger.debug(f"YAML缓存目录不可用: {directory} | {e}")
+        return None
+    if not S_ISDIR(st.st_mode):
+        return None
+    if hasattr(os, "getuid") and (st.st_uid != os.getuid() or st.st_mode & 0o077):
+        logger.debug(f"YAML缓存目录不属于当前用户或权限过宽, 不使用缓存: {directory}")
+        return None
+    return directory
+
+
+def _cache_path(directory: Path, source: str) -> Path:
+    """获取YAML文件 (绝对路径) 对应的缓存文件路径"""
+    digest = hashlib.sha256(source.encode("utf-8", "surrogatepass")).hexdigest()
+    return directory / (digest + CACHE_SUFFIX)
+
+
+# 只读打开标志: POSIX 下附加 O_CLOEXEC, Windows 下以二进制模式读取
+_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+
+# 缓存临时文件创建标志: 必须新建, 不复用已存在的文件
+_CREATE_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_EXCL
+    | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+)
+
+
+def _read_bytes(path: Path, size: int) -> bytes:
+    """
+    按已知大小读取整个文件
+
+    绕过缓冲IO包装, 小文件通常一次 read 系统调用即可读完。
+    """
+    fd = os.open(path, _OPEN_FLAGS)
+    try:
+        data = os.read(fd, size + 1)
+        if len(data) <= size:
+            return data
+        # 文件在 stat 之后变大, 读完剩余部分
+        chunks = [data]
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
+def _load_json(path: Path, size: int) -> Any:
+    """解析JSON文件 (msgspec 可用时优先使用)"""
+    data = _read_bytes(path, size)
+    if MSGSPEC_AVAILABLE:
+        return msgspec.json.decode(data)
+    return json.loads(data)
+
+
+def scan_dir(directory: Union[str, Path]) -> Dict[str, os.stat_result]:
+    """
+    一次遍历目录, 收集其中文件的元数据
+
+    Args:
+        directory: 目录路径
+
+    Returns:
+        {文件名: stat结果} 字典 (目录不存在时为空)
+    """
+    index = {}
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_file():
+                    index[entry.name] = entry.stat()
+    except OSError:
+        pass
+    return index
+
+
+def _stat(
+    path: Path,
+    dir_index: Optional[Mapping[str, os.stat_result]],
+) -> os.stat_result:
+    """获取文件元数据, 提供目录索引时直接查表 (不存在时抛出 FileNotFoundError)"""
+    if dir_index is None:
+        return path.stat()
+    try:
+        return dir_index[path.name]
+    except KeyError:
+        raise FileNotFoundError(str(path)) from None
+
+
+def load_yaml(
+    path: Union[str, Path],
+    dir_index: Optional[Mapping[str, os.stat_result]] = None,
+) -> Any:
+    """
+    加载YAML文件 (优先使用同名JSON或缓存)
+
+    同名JSON文件的修改时间不早于YAML时直接解析JSON。
+    缓存以源文件的绝对路径、修改时间和大小为键, 任一变化即重新解析并刷新缓存。
+    JSON或缓存读取失败时自动回退为直接解析YAML。
+
+    Args:
+        path: YAML文件路径
+        dir_index: 文件所在目录的 scan_dir() 结果 (None表示逐个 stat)
+
+    Returns:
+        解析后的数据 (空文件返回None)
+    """
+    path = Path(path)
+    stat = _stat(path, dir_index)
+
+    json_path = path.with_suffix(".json")
+    try:
+        json_stat = _stat(json_path, dir_index)
+        if json_stat.st_mtime_ns >= stat.st_mtime_ns:
+            return _load_json(json_path, json_stat.st_size)
+        logger.debug(f"JSON文件早于YAML, 忽略: {json_path}")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"解析JSON配置失败, 改用YAML: {json_path} | {e}")
+
+    directory = _cache_dir()
+    if directory is None:
+        return yaml.load(_read_bytes(path, stat.st_size), Loader=_Loader)
+
+    source = os.path.abspath(path)
+    key = (CACHE_VERSION, source, stat.st_mtime_ns, stat.st_size)
+    cache_path = _cache_path(directory, source)
+
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, data = marshal.load(f)
+        if cached_key == key:
+            return data
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"YAML缓存无效, 重新解析: {cache_path} | {e}")
+
+    # 直接把字节交给解析器 (按 UTF-8/BOM 自动识别编码)
+    data = yaml.load(_read_bytes(path, stat.st_size), Loader=_Loader)
+
+    # 先写临时文件再替换, 避免并发进程读到不完整的缓存;
+    # 含日期等 marshal 不支持的类型时 dumps 抛出 ValueError, 不缓存
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        payload = marshal.dumps((key, data))
+        fd = os.open(tmp_path, _CREATE_FLAGS, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.debug(f"写入YAML缓存失败: {cache_path} | {e}")
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+    return data
+
+
+__all__ = ["load_yaml", "scan_dir"]
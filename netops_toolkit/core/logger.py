@@ -8,8 +8,12 @@
 - 结构化日志格式
 """
 
+import atexit
+import queue
 import sys
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union
 
@@ -28,6 +32,8 @@ DEFAULT_FILE_FORMAT = (
     "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | "
     "{name}:{function}:{line} | {message}"
 )
+# 审计日志通道: 审计记录绑定 extra["_channel"] = AUDIT_CHANNEL
+AUDIT_CHANNEL = "audit"
 AUDIT_FORMAT = (
     "{time:YYYY-MM-DD HH:mm:ss} | AUDIT | "
     "user={extra[user]} | action={extra[action]} | "
@@ -61,23 +67,29 @@ def setup_logging(
     # 移除默认处理器
     logger.remove()
     
-    # 设置日志目录
+    # 设置日志目录 (由文件处理器在首次写入时创建)
     if log_dir is None:
         log_dir = DEFAULT_LOG_DIR
     log_dir = Path(log_dir)
-    log_dir.mkdir(parents=True, exist_ok=True)
     
     # 添加控制台处理器
     if enable_console:
+        # 非终端 (CI、管道重定向) 时使用无颜色标记的格式, 省去着色开销
+        is_tty = getattr(sys.stderr, "isatty", lambda: False)()
+        # 仅 DEBUG 级别输出完整回溯和变量诊断 (需要逐帧检查, 开销较大)
+        verbose = log_level.upper() == "DEBUG"
         logger.add(
             sys.stderr,
-            format=DEFAULT_LOG_FORMAT,
+            format=DEFAULT_LOG_FORMAT if is_tty else DEFAULT_FILE_FORMAT,
             level=log_level,
-            colorize=True,
-            backtrace=True,
-            diagnose=True,
+            colorize=is_tty,
+            backtrace=verbose,
+            diagnose=verbose,
         )
     
+    # 文件处理器均使用 delay=True: 首条日志写入时才创建目录并打开文件,
+    # 不产生日志的运行 (如 --help) 不会触及文件系统
+    
     # 添加文件处理器 - 常规日志
     if enable_file:
         logger.add(
@@ -88,6 +100,7 @@ def setup_logging(
             retention=retention,
             compression=compression,
             encoding="utf-8",
+            delay=True,
             enqueue=True,  # 异步写入,提高性能
         )
         
@@ -100,6 +113,7 @@ def setup_logging(
             retention=retention,
             compression=compression,
             encoding="utf-8",
+            delay=True,
             enqueue=True,
         )
     
@@ -109,21 +123,44 @@ def setup_logging(
             log_dir / "audit_{time:YYYY-MM-DD}.log",
             format=AUDIT_FORMAT,
             level="INFO",
-            filter=lambda record: record["extra"].get("audit", False),
+            filter=_is_audit_record,
             rotation="1 day",
             retention="90 days",  # 审计日志保留更长时间
             compression=compression,
             encoding="utf-8",
+            delay=True,
             enqueue=True,
         )
     
-    logger.info(f"日志系统已初始化 | 目录: {log_dir} | 级别: {log_level}")
+    # 使用 DEBUG 级别, 避免仅为这条消息创建日志文件
+    logger.debug(f"日志系统已初始化 | 目录: {log_dir} | 级别: {log_level}")
+
+
+def _is_audit_record(record) -> bool:
+    """审计处理器过滤器: 只接收审计通道的记录 (兼容旧的 bind(audit=True) 写法)"""
+    extra = record["extra"]
+    return extra.get("_channel") == AUDIT_CHANNEL or bool(extra.get("audit", False))
+
 
+def _restore_audit_time(record) -> None:
+    """使用审计记录入队时的时间戳, 而不是写出时的时间"""
+    timestamp = record["extra"].pop("_audit_ts", None)
+    if timestamp is not None:
+        now = record["time"]
+        record["time"] = type(now).fromtimestamp(timestamp, now.tzinfo)
 
+
+# 审计专用 logger (只创建一次, 写出时不再逐条构建 patch/bind 对象)
+_audit_logger = logger.patch(_restore_audit_time).bind(_channel=AUDIT_CHANNEL)
+
+
+@lru_cache(maxsize=None)
 def get_logger(name: str = "netops"):
     """
     获取日志记录器实例
     
+    同名调用返回同一个绑定实例 (绑定的 logger 共享全局处理器, 可跨线程使用)。
+    
     Args:
         name: 日志记录器名称 (用于标识日志来源)
         
@@ -133,6 +170,11 @@ def get_logger(name: str = "netops"):
     return logger.bind(name=name)
 
 
+# 审计日志缓冲: 记录先进入内存队列, 达到上限或进程退出时批量写出
+AUDIT_BUFFER_SIZE = 64
+_audit_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+
+
 def log_audit(
     user: str,
     action: str,
@@ -143,6 +185,9 @@ def log_audit(
     """
     记录审计日志
     
+    记录会先缓冲在内存中 (保留调用时刻的时间戳), 缓冲满
+    AUDIT_BUFFER_SIZE 条或进程退出时由 flush_audit() 统一写出。
+    
     Args:
         user: 执行操作的用户
         action: 操作类型 (e.g., "ssh_connect", "config_backup", "ping_test")
@@ -150,13 +195,27 @@ def log_audit(
         result: 操作结果 (success, failed, partial)
         message: 附加说明
     """
-    logger.bind(
-        audit=True,
-        user=user,
-        action=action,
-        target=target,
-        result=result,
-    ).info(message or f"操作: {action} -> {target}")
+    _audit_queue.put((
+        time.time(),
+        {"user": user, "action": action, "target": target, "result": result},
+        message or f"操作: {action} -> {target}",
+    ))
+    if _audit_queue.qsize() >= AUDIT_BUFFER_SIZE:
+        flush_audit()
+
+
+def flush_audit() -> None:
+    """将缓冲的审计日志全部写出"""
+    while True:
+        try:
+            timestamp, fields, message = _audit_queue.get_nowait()
+        except queue.Empty:
+            return
+        _audit_logger.bind(_audit_ts=timestamp, **fields).info(message)
+
+
+# 在 loguru 自身的退出清理之前写出剩余审计记录 (atexit 按注册的逆序执行)
+atexit.register(flush_audit)
 
 
 class LogContext:
@@ -191,6 +250,7 @@ __all__ = [
     "setup_logging",
     "get_logger",
     "log_audit",
+    "flush_audit",
     "LogContext",
     "logger",
 ]
@@ -5,33 +5,170 @@
 支持 Windows、Linux、macOS、FreeBSD、OpenBSD 等多种系统。
 """
 
+import json
 import os
+import re
 import sys
+import time
 import platform
 import socket
+import struct
+import threading
 import uuid
 import subprocess
-from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from functools import lru_cache
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Collection, Dict, List, Optional, Tuple
 
 from netops_toolkit.core.logger import get_logger
 
+# 可选依赖: psutil (缺失时各检测项使用平台相关的备用方案)
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
 logger = get_logger(__name__)
 
+# Python 3.10+ 的 dataclass 支持 slots, 省去实例 __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# FQDN 反向解析的最长等待时间 (秒)
+FQDN_TIMEOUT = 1.5
+
+# 系统信息磁盘缓存 (静态信息跨进程复用, 超过有效期后重新检测), 路径由 _cache_file() 确定
+CACHE_FILE_NAME = "system_info.json"
+CACHE_TTL = 3600  # 秒
+CACHE_VERSION = 4
+
+# DNS 服务器探测结果的有效期 (秒), 探测可能需要启动 ipconfig/systemd-resolve
+DNS_CACHE_TTL = 300
+
+# 动态信息的有效期 (秒): 检测方法名 -> 有效期
+# 其余信息 (操作系统、主机、CPU、Python) 在进程内视为不变
+DYNAMIC_TTL = (
+    ("_detect_memory", 2.0),
+    ("_detect_interfaces", 30.0),
+    ("_detect_dns", float(DNS_CACHE_TTL)),
+    ("_detect_time", 1.0),  # 系统时间精确到秒
+)
+
+# 不纳入统计的回环/虚拟网络接口名前缀 (容器网桥、veth、Hyper-V 虚拟交换机等)
+VIRTUAL_IFACE_PREFIXES = (
+    "lo", "Loopback", "docker", "veth", "br-", "virbr", "vEthernet",
+)
+
+# /proc/meminfo 中需要的字段 (单位 KB)
+_MEMINFO_RE = re.compile(rb"^(MemTotal|MemAvailable|MemFree):[ \t]+(\d+)", re.MULTILINE)
+
+# resolv.conf 中的 nameserver 行
+RESOLV_CONF = "/etc/resolv.conf"
+_NAMESERVER_RE = re.compile(r"^[ \t]*nameserver[ \t]+(\S+)", re.MULTILINE)
+
+# 无 psutil 时本机 IP 探测: UDP connect 的超时 (秒) 与结果有效期 (秒)
+LOCAL_IP_PROBE_TIMEOUT = 0.3
+LOCAL_IP_TTL = 60
+
+# 本机 IP 探测缓存: (探测时刻, IP)
+_local_ip_cache: Optional[tuple] = None
+
+
+def _probe_local_ip() -> Optional[str]:
+    """
+    获取默认路由出口的本机 IP (结果缓存 LOCAL_IP_TTL 秒)
+    
+    UDP connect 不发送数据, 只让内核选路; 使用数字地址并设置超时,
+    默认路由异常时不会长时间阻塞。失败时回退为解析本机主机名。
+    """
+    global _local_ip_cache
+    
+    now = time.monotonic()
+    if _local_ip_cache is not None and now - _local_ip_cache[0] < LOCAL_IP_TTL:
+        return _local_ip_cache[1]
+    
+    local_ip = None
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.settimeout(LOCAL_IP_PROBE_TIMEOUT)
+            s.connect(("8.8.8.8", 80))
+            local_ip = s.getsockname()[0]
+    except OSError:
+        try:
+            local_ip = socket.gethostbyname(socket.gethostname())
+        except OSError:
+            pass
+    
+    _local_ip_cache = (now, local_ip)
+    return local_ip
+
+
+@lru_cache(maxsize=None)
+def _platform_value(name: str) -> Any:
+    """
+    调用 platform 模块的无参函数并缓存结果
+    
+    win32_ver() 读取注册表, mac_ver() 读取系统 plist, processor() 在部分平台
+    会启动子进程; 这些值在进程生命周期内不变, 只需获取一次。
+    """
+    return getattr(platform, name)()
+
+
+def _uname() -> "platform.uname_result":
+    """获取 uname 信息 (system/release/version/machine 一次取得, 结果已缓存)"""
+    return _platform_value("uname")
+
+
+@lru_cache(maxsize=None)
+def _env_value(name: str) -> str:
+    """读取环境变量并缓存 (检测期间视为不变)"""
+    return os.environ.get(name, "")
 
-@dataclass
+
+def _resolve_fqdn(hostname: str, timeout: float = FQDN_TIMEOUT) -> str:
+    """
+    在后台线程中解析 FQDN, 超时则回退为主机名
+    
+    只做一次正向解析 (gethostbyname_ex), 取规范名或别名中第一个完整域名;
+    不像 socket.getfqdn() 那样再做反向 DNS 查询。
+    使用守护线程执行, 超时后不再等待, 也不会阻塞进程退出。
+    """
+    result = [hostname]
+    
+    def worker():
+        try:
+            name, aliases, _ = socket.gethostbyname_ex(hostname)
+        except Exception:
+            return
+        for candidate in (name, *aliases):
+            if "." in candidate:
+                result[0] = candidate
+                return
+    
+    thread = threading.Thread(target=worker, name="netops-fqdn", daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        logger.debug(f"FQDN 解析超时 ({timeout}s), 使用主机名: {hostname}")
+        return hostname
+    return result[0]
+
+
+@dataclass(frozen=True, **_SLOTS)
 class NetworkInterface:
-    """网络接口信息"""
+    """网络接口信息 (不可变, 可作为字典键或集合元素)"""
     name: str
     mac_address: str = ""
-    ipv4_addresses: List[str] = field(default_factory=list)
-    ipv6_addresses: List[str] = field(default_factory=list)
+    ipv4_addresses: Tuple[str, ...] = ()
+    ipv6_addresses: Tuple[str, ...] = ()
     is_up: bool = False
     mtu: int = 0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SystemInfo:
     """系统信息数据类"""
     # 操作系统
@@ -70,102 +207,569 @@ class SystemInfo:
     uptime: str = ""
     
     def to_dict(self) -> Dict[str, Any]:
-        """转换为字典"""
-        return {
-            "os": {
-                "name": self.os_name,
-                "version": self.os_version,
-                "release": self.os_release,
-                "arch": self.os_arch,
-                "platform": self.os_platform,
-            },
-            "host": {
-                "hostname": self.hostname,
-                "fqdn": self.fqdn,
-                "machine_id": self.machine_id,
-            },
-            "hardware": {
-                "cpu_name": self.cpu_name,
-                "cpu_cores": self.cpu_cores,
-                "cpu_threads": self.cpu_threads,
-                "memory_total_gb": self.memory_total_gb,
-                "memory_available_gb": self.memory_available_gb,
-            },
-            "python": {
-                "version": self.python_version,
-                "implementation": self.python_implementation,
-                "path": self.python_path,
-                "virtual_env": self.virtual_env,
-            },
-            "network": {
-                "interfaces": [
-                    {
-                        "name": iface.name,
-                        "mac": iface.mac_address,
-                        "ipv4": iface.ipv4_addresses,
-                        "ipv6": iface.ipv6_addresses,
-                        "is_up": iface.is_up,
-                    }
-                    for iface in self.network_interfaces
-                ],
-                "default_gateway": self.default_gateway,
-                "dns_servers": self.dns_servers,
-            },
-            "time": {
-                "timezone": self.timezone,
-                "current": self.current_time,
-                "uptime": self.uptime,
-            },
+        """转换为字典 (按 _DICT_SCHEMA 分组并重命名字段)"""
+        result = {
+            group: dict(zip(keys, getter(self)))
+            for group, keys, getter in _DICT_GETTERS
         }
+        network = result["network"]
+        network["interfaces"] = [
+            dict(zip(_IFACE_KEYS, _iface_attrs(iface)))
+            for iface in self.network_interfaces
+        ]
+        # 返回副本, 调用方修改结果不影响本对象
+        network["dns_servers"] = list(self.dns_servers)
+        return result
+
+
+# to_dict() 输出结构: (分组, ((输出键, 字段名), ...)), 顺序即输出顺序
+_DICT_SCHEMA = (
+    ("os", (
+        ("name", "os_name"),
+        ("version", "os_version"),
+        ("release", "os_release"),
+        ("arch", "os_arch"),
+        ("platform", "os_platform"),
+    )),
+    ("host", (
+        ("hostname", "hostname"),
+        ("fqdn", "fqdn"),
+        ("machine_id", "machine_id"),
+    )),
+    ("hardware", (
+        ("cpu_name", "cpu_name"),
+        ("cpu_cores", "cpu_cores"),
+        ("cpu_threads", "cpu_threads"),
+        ("memory_total_gb", "memory_total_gb"),
+        ("memory_available_gb", "memory_available_gb"),
+    )),
+    ("python", (
+        ("version", "python_version"),
+        ("implementation", "python_implementation"),
+        ("path", "python_path"),
+        ("virtual_env", "virtual_env"),
+    )),
+    ("network", (
+        ("interfaces", "network_interfaces"),
+        ("default_gateway", "default_gateway"),
+        ("dns_servers", "dns_servers"),
+    )),
+    ("time", (
+        ("timezone", "timezone"),
+        ("current", "current_time"),
+        ("uptime", "uptime"),
+    )),
+)
+
+# 网络接口的输出键 (mtu 不输出)
+_IFACE_SCHEMA = (
+    ("name", "name"),
+    ("mac", "mac_address"),
+    ("ipv4", "ipv4_addresses"),
+    ("ipv6", "ipv6_addresses"),
+    ("is_up", "is_up"),
+)
+
+# 按分组预先构建 attrgetter, 一次调用取出该组全部字段
+_DICT_GETTERS = tuple(
+    (group, tuple(key for key, _ in fields), attrgetter(*(name for _, name in fields)))
+    for group, fields in _DICT_SCHEMA
+)
+_IFACE_KEYS = tuple(key for key, _ in _IFACE_SCHEMA)
+_iface_attrs = attrgetter(*(name for _, name in _IFACE_SCHEMA))
+
+# 各平台一次 sysctl 调用读取的键 (CPU 型号与总内存)
+SYSCTL_KEYS = {
+    "Darwin": ("machdep.cpu.brand_string", "hw.memsize"),
+    "FreeBSD": ("hw.model", "hw.physmem"),
+    "OpenBSD": ("hw.model", "hw.physmem"),
+    "NetBSD": ("hw.model", "hw.physmem"),
+}
+
+# sysctl 结果缓存 (CPU 与内存检测并发执行, 由锁保证只调用一次)
+_sysctl_cache: Optional[Dict[str, str]] = None
+_sysctl_lock = threading.Lock()
+
+
+def _sysctl_batch(keys: Tuple[str, ...]) -> Dict[str, str]:
+    """
+    一次 sysctl 调用读取多个键
+    
+    sysctl -n 按参数顺序每行输出一个值; 某个键不存在时输出行数对不上,
+    此时改为逐个读取。
+    """
+    def run(names):
+        result = subprocess.run(
+            ["sysctl", "-n", *names],
+            capture_output=True, text=True, timeout=5
+        )
+        return result.stdout.splitlines()
+    
+    values = {}
+    if not keys:
+        return values
+    try:
+        lines = run(keys)
+        if len(lines) == len(keys):
+            return {key: line.strip() for key, line in zip(keys, lines)}
+        for key in keys:
+            lines = run((key,))
+            if len(lines) == 1:
+                values[key] = lines[0].strip()
+    except Exception:
+        pass
+    return values
+
+
+def _sysctl_values() -> Dict[str, str]:
+    """获取当前平台 SYSCTL_KEYS 的值 (进程内只调用一次 sysctl)"""
+    global _sysctl_cache
+    
+    with _sysctl_lock:
+        if _sysctl_cache is None:
+            _sysctl_cache = _sysctl_batch(SYSCTL_KEYS.get(_uname().system, ()))
+        return _sysctl_cache
+
+
+# /proc/cpuinfo 中的 CPU 型号行 (要求行已完整读入)
+_CPU_MODEL_RE = re.compile(rb"^model name[ \t]*:[ \t]*(.+)\n", re.MULTILINE)
+
+
+def _darwin_cpu_brand() -> str:
+    """macOS: 通过 sysctlbyname 读取 CPU 型号 (不启动 sysctl 子进程)"""
+    import ctypes
+    
+    libc = ctypes.CDLL("libc.dylib")
+    name = b"machdep.cpu.brand_string"
+    size = ctypes.c_size_t(0)
+    if libc.sysctlbyname(name, None, ctypes.byref(size), None, 0) != 0:
+        return ""
+    buf = ctypes.create_string_buffer(size.value)
+    if libc.sysctlbyname(name, buf, ctypes.byref(size), None, 0) != 0:
+        return ""
+    return buf.value.decode("utf-8", "replace").strip()
+
+
+@lru_cache(maxsize=None)
+def _read_cpu_name() -> str:
+    """
+    获取 CPU 名称 (进程内只读取一次)
+    
+    Linux 下 platform.processor() 通常为空 (且会执行 uname -p),
+    因此 Linux/macOS 先直接读取系统接口, 失败时才回退到 platform.processor()。
+    """
+    system = _uname().system
+    
+    # Linux: 从 /proc/cpuinfo 获取
+    if system == "Linux":
+        try:
+            with open("/proc/cpuinfo", "rb") as f:
+                # 第一个 CPU 的信息块通常不超过 4KB, 找到即停止读取
+                data = f.read(4096)
+                match = _CPU_MODEL_RE.search(data)
+                if match is None:
+                    data += f.read()
+                    match = _CPU_MODEL_RE.search(data)
+            if match is not None:
+                return match.group(1).decode("utf-8", "replace").strip()
+        except Exception:
+            pass
+    
+    # macOS: 使用 sysctlbyname, 失败时使用 sysctl 命令
+    elif system == "Darwin":
+        try:
+            cpu_name = _darwin_cpu_brand()
+            if cpu_name:
+                return cpu_name
+        except Exception:
+            pass
+        cpu_name = _sysctl_values().get("machdep.cpu.brand_string")
+        if cpu_name:
+            return cpu_name
+    
+    cpu_name = _platform_value("processor")
+    if cpu_name:
+        return cpu_name
+    
+    # BSD: 使用 sysctl
+    if system in SYSCTL_KEYS:
+        cpu_name = _sysctl_values().get("hw.model")
+        if cpu_name:
+            return cpu_name
+    
+    return "Unknown CPU"
+
+
+def _uptime_seconds() -> Optional[int]:
+    """
+    获取系统运行秒数
+    
+    Linux 直接读取 /proc/uptime, 其他平台使用 psutil.boot_time();
+    均不可用时返回 None。
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/uptime", "rb") as f:
+                return int(float(f.read().split()[0]))
+        except (OSError, ValueError, IndexError):
+            pass
+    if PSUTIL_AVAILABLE:
+        return int(time.time() - psutil.boot_time())
+    return None
+
+
+# 路由表标志: RTF_UP | RTF_GATEWAY
+_RTF_UP_GATEWAY = 0x0003
+
+
+def _read_default_gateway() -> str:
+    """
+    从 /proc/net/route 读取 IPv4 默认网关 (仅 Linux, 其他平台返回空字符串)
+    
+    目标为 00000000 的路由即默认路由, 网关字段是按本机字节序输出的十六进制数。
+    """
+    if not sys.platform.startswith("linux"):
+        return ""
+    try:
+        with open("/proc/net/route", "rb") as f:
+            lines = f.read().splitlines()[1:]
+    except OSError:
+        return ""
+    for line in lines:
+        fields = line.split()
+        if len(fields) < 4 or fields[1] != b"00000000":
+            continue
+        try:
+            if int(fields[3], 16) & _RTF_UP_GATEWAY != _RTF_UP_GATEWAY:
+                continue
+            return socket.inet_ntoa(struct.pack("=L", int(fields[2], 16)))
+        except (ValueError, struct.error):
+            continue
+    return ""
+
+
+# 机器 ID 文件 (systemd / D-Bus)
+MACHINE_ID_FILES = ("/etc/machine-id", "/var/lib/dbus/machine-id")
+
+
+@lru_cache(maxsize=None)
+def _read_machine_id() -> str:
+    """
+    获取稳定的机器 ID (进程内只读取一次)
+    
+    依次尝试 machine-id 文件、Windows 注册表 MachineGuid,
+    最后回退为 uuid.getnode() (基于网卡 MAC, 更换网卡后会变化)。
+    """
+    for path in MACHINE_ID_FILES:
+        try:
+            with open(path, encoding="ascii", errors="ignore") as f:
+                machine_id = f.read().strip()
+            if machine_id:
+                return machine_id
+        except OSError:
+            continue
+    
+    if sys.platform == "win32":
+        try:
+            import winreg
+            with winreg.OpenKey(
+                winreg.HKEY_LOCAL_MACHINE,
+                r"SOFTWARE\Microsoft\Cryptography",
+                0,
+                winreg.KEY_READ | winreg.KEY_WOW64_64KEY,
+            ) as key:
+                machine_id = winreg.QueryValueEx(key, "MachineGuid")[0]
+            if machine_id:
+                return str(machine_id)
+        except OSError:
+            pass
+    
+    try:
+        return str(uuid.getnode())
+    except Exception:
+        return "unknown"
+
+
+# os-release 文件位置 (按 systemd 规范的优先顺序)
+OS_RELEASE_FILES = ("/etc/os-release", "/usr/lib/os-release")
+
+# os-release 中的 KEY=value 行 (注释行不匹配)
+_OS_RELEASE_RE = re.compile(
+    r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t]*$", re.MULTILINE
+)
+
+# lsb-release 中的发行版描述
+_LSB_DESCRIPTION_RE = re.compile(r"^DISTRIB_DESCRIPTION=(.*)$", re.MULTILINE)
+
+
+def _read_os_release() -> Dict[str, str]:
+    """
+    读取并解析 os-release 文件
+    
+    结果由 SystemDetector._get_linux_distro() 在进程内缓存, 此处不再单独缓存。
+    
+    Returns:
+        键值字典, 文件不存在或无法读取时返回空字典
+    """
+    for path in OS_RELEASE_FILES:
+        try:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                data = f.read()
+        except OSError:
+            continue
+        return {k: v.strip("\"'") for k, v in _OS_RELEASE_RE.findall(data)}
+    
+    return {}
+
+
+# iphlpapi (Windows DNS 查询) 使用的 Win32 常量
+_AF_UNSPEC = 0
+_GAA_FLAG_SKIP_UNICAST = 0x0001
+_GAA_FLAG_SKIP_ANYCAST = 0x0002
+_GAA_FLAG_SKIP_MULTICAST = 0x0004
+_GAA_FLAG_SKIP_FRIENDLY_NAME = 0x0020
+_ERROR_SUCCESS = 0
+_ERROR_BUFFER_OVERFLOW = 111
+_IF_OPER_STATUS_UP = 1
+_MAX_HOSTNAME_LEN = 128
+_MAX_DOMAIN_NAME_LEN = 128
+_MAX_SCOPE_ID_LEN = 256
 
 
 class SystemDetector:
     """系统信息检测器"""
     
+    __slots__ = ("_info", "_lock", "_refreshed")
+    
+    # FQDN 解析结果缓存: 主机名 -> FQDN (跨实例共享, 刷新时不重复解析)
+    _fqdn_cache: Dict[str, str] = {}
+    
     def __init__(self):
         self._info: Optional[SystemInfo] = None
+        self._lock = threading.Lock()
+        # 动态检测项上次执行的时刻 (time.monotonic)
+        self._refreshed: Dict[str, float] = {}
     
-    def detect(self, refresh: bool = False) -> SystemInfo:
+    def detect(
+        self,
+        refresh: bool = False,
+        probes: Optional[Collection[str]] = None,
+    ) -> SystemInfo:
         """
         检测系统信息
         
+        已检测过时, 只重新检测超过 DYNAMIC_TTL 有效期的动态信息;
+        均未过期时直接返回上次的结果。
+        
         Args:
             refresh: 是否强制刷新缓存
+            probes: 需要保持新鲜的动态检测项 (DYNAMIC_TTL 中的方法名),
+                None 表示全部; 其余动态信息沿用上次的结果
             
         Returns:
             SystemInfo 对象
         """
-        if self._info is not None and not refresh:
+        info = self._info
+        if (
+            info is not None
+            and not refresh
+            and not self._is_stale(time.monotonic(), probes)
+        ):
+            return info
+        
+        # 双重检查: 并发调用时只有一个线程执行检测, 其余线程复用结果
+        with self._lock:
+            if self._info is not info:
+                return self._info
+            if info is not None and not refresh:
+                return self._refresh_stale(probes)
+            return self._detect_locked(refresh)
+    
+    def _stale_probes(
+        self, now: float, probes: Optional[Collection[str]]
+    ) -> List[str]:
+        """获取已过期的动态检测项"""
+        refreshed = self._refreshed
+        return [
+            name for name, ttl in DYNAMIC_TTL
+            if (probes is None or name in probes)
+            and now - refreshed.get(name, 0.0) >= ttl
+        ]
+    
+    def _is_stale(self, now: float, probes: Optional[Collection[str]] = None) -> bool:
+        """是否有动态信息已过期"""
+        return bool(self._stale_probes(now, probes))
+    
+    def _refresh_stale(self, probes: Optional[Collection[str]] = None) -> SystemInfo:
+        """
+        重新检测已过期的动态信息 (调用方需持有 self._lock)
+        
+        在副本上检测后整体替换, 其他线程持有的旧对象不会被修改。
+        """
+        now = time.monotonic()
+        stale = self._stale_probes(now, probes)
+        if not stale:
             return self._info
+        info = replace(self._info)
+        for name in stale:
+            getattr(self, name)(info)
+            self._refreshed[name] = now
+        self._info = info
+        return info
+    
+    def _mark_refreshed(self, names: Optional[Collection[str]] = None) -> None:
+        """记录动态信息为刚刚检测 (names 为实际执行的检测项, 默认全部)"""
+        now = time.monotonic()
+        if names is None:
+            names = [name for name, _ in DYNAMIC_TTL]
+        self._refreshed = {name: now for name in names}
+    
+    def _detect_locked(self, refresh: bool) -> SystemInfo:
+        """执行检测 (调用方需持有 self._lock)"""
+        if refresh:
+            _clear_probe_caches()
+        
+        info = None if refresh else self._load_cache()
+        if info is not None:
+            # 缓存命中: 只重新检测随时间/进程变化的信息
+            self._info = info
+            self._mark_refreshed(self._detect_dynamic(info))
+            logger.debug("系统信息已从缓存加载")
+            return info
         
         logger.info("开始检测系统信息...")
         info = SystemInfo()
         
-        # 检测各项信息
-        self._detect_os(info)
-        self._detect_host(info)
-        self._detect_hardware(info)
-        self._detect_python(info)
-        self._detect_network(info)
-        self._detect_time(info)
+        # 各检测项互相独立且写入不同字段, 并发执行 (耗时取决于最慢的一项)
+        detectors = (
+            self._detect_os,
+            self._detect_host,
+            self._detect_hardware,
+            self._detect_memory,
+            self._detect_python,
+            self._detect_network,
+            self._detect_time,
+        )
+        with ThreadPoolExecutor(
+            max_workers=len(detectors), thread_name_prefix="netops-detect"
+        ) as executor:
+            futures = [executor.submit(detector, info) for detector in detectors]
+        # 逐个取结果, 与串行执行时一样抛出检测中的异常
+        for future in futures:
+            future.result()
         
         self._info = info
+        self._mark_refreshed()
+        self._save_cache(info)
         logger.info("系统信息检测完成")
         return info
     
+    def _detect_dynamic(self, info: SystemInfo) -> List[str]:
+        """
+        检测动态信息 (DYNAMIC_TTL 各项及 Python 环境), 缓存命中时调用
+        
+        Returns:
+            实际执行的 DYNAMIC_TTL 检测项名称
+        """
+        self._detect_python(info)
+        names = [name for name, _ in DYNAMIC_TTL]
+        for name in names:
+            getattr(self, name)(info)
+        return names
+    
+    @staticmethod
+    def _cache_file() -> Optional[Path]:
+        """
+        获取系统信息磁盘缓存路径 (使用时才解析, 导入模块不依赖主目录)
+        
+        Returns:
+            缓存文件路径, 未设置 XDG_CACHE_HOME 且无法确定主目录时返回 None
+        """
+        try:
+            base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+        except RuntimeError:
+            return None
+        return base / "netops_toolkit" / CACHE_FILE_NAME
+    
+    def _load_cache(self) -> Optional[SystemInfo]:
+        """
+        从磁盘缓存加载系统信息
+        
+        Returns:
+            SystemInfo 对象, 缓存不存在、过期、格式不符、不属于本机
+            或主机名已变更时返回 None
+        """
+        cache_file = self._cache_file()
+        if cache_file is None:
+            return None
+        try:
+            if time.time() - cache_file.stat().st_mtime > CACHE_TTL:
+                return None
+            with open(cache_file, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_VERSION:
+                return None
+            if data.get("machine_id") != _read_machine_id():
+                return None
+            
+            fields = data["info"]
+            if fields.get("hostname") != socket.gethostname():
+                # 主机名已变更, 主机/FQDN 信息需要重新检测
+                return None
+            fields["network_interfaces"] = [
+                NetworkInterface(
+                    **dict(
+                        iface,
+                        ipv4_addresses=tuple(iface.get("ipv4_addresses", ())),
+                        ipv6_addresses=tuple(iface.get("ipv6_addresses", ())),
+                    )
+                )
+                for iface in fields.get("network_interfaces", [])
+            ]
+            return SystemInfo(**fields)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"系统信息缓存无效: {e}")
+            return None
+    
+    def _save_cache(self, info: SystemInfo) -> None:
+        """将系统信息写入磁盘缓存 (无法确定缓存路径或写入失败时忽略)"""
+        cache_file = self._cache_file()
+        if cache_file is None:
+            return
+        data = {
+            "version": CACHE_VERSION,
+            "machine_id": info.machine_id,
+            "info": asdict(info),
+        }
+        tmp_path = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_file)
+        except Exception as e:
+            logger.debug(f"写入系统信息缓存失败: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+    
     def _detect_os(self, info: SystemInfo) -> None:
         """检测操作系统信息"""
-        system = platform.system()  # Windows, Linux, Darwin, FreeBSD, etc.
-        info.os_version = platform.version()
-        info.os_release = platform.release()
-        info.os_arch = platform.machine()
-        info.os_platform = platform.platform()
+        uname = _uname()
+        system = uname.system  # Windows, Linux, Darwin, FreeBSD, etc.
+        info.os_version = uname.version
+        info.os_release = uname.release
+        info.os_arch = uname.machine
+        info.os_platform = _platform_value("platform")
         
         # 获取更友好的 OS 名称
         if system == "Windows":
-            info.os_name = f"Windows {platform.win32_ver()[0]}"
+            info.os_name = f"Windows {_platform_value('win32_ver')[0]}"
         elif system == "Darwin":
-            info.os_name = f"macOS {platform.mac_ver()[0]}"
+            info.os_name = f"macOS {_platform_value('mac_ver')[0]}"
         elif system == "Linux":
             info.os_name = self._get_linux_distro()
         elif system == "FreeBSD":
@@ -181,9 +785,20 @@ class SystemDetector:
         else:
             info.os_name = f"{system} {info.os_release}"
     
-    def _get_linux_distro(self) -> str:
-        """获取 Linux 发行版信息"""
-        # 方法1: 使用 distro 库
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_linux_distro() -> str:
+        """获取 Linux 发行版信息 (进程内只检测一次, 命中的来源之后不再继续尝试)"""
+        # 方法1: 读取 os-release (systemd 规范的标准来源, 无需导入 distro)
+        os_info = _read_os_release()
+        if os_info:
+            if "PRETTY_NAME" in os_info:
+                return os_info["PRETTY_NAME"]
+            if "NAME" in os_info:
+                version = os_info.get("VERSION", os_info.get("VERSION_ID", ""))
+                return f"{os_info['NAME']} {version}".strip()
+        
+        # 方法2: os-release 不存在时 (精简系统/容器) 使用 distro 库
         try:
             import distro
             name = distro.name(pretty=True)
@@ -192,48 +807,39 @@ class SystemDetector:
         except ImportError:
             pass
         
-        # 方法2: 读取 /etc/os-release (最标准的方法)
-        try:
-            with open("/etc/os-release") as f:
-                os_info = {}
-                for line in f:
-                    line = line.strip()
-                    if "=" in line:
-                        key, value = line.split("=", 1)
-                        os_info[key] = value.strip('"')
-                
-                if "PRETTY_NAME" in os_info:
-                    return os_info["PRETTY_NAME"]
-                elif "NAME" in os_info:
-                    version = os_info.get("VERSION", os_info.get("VERSION_ID", ""))
-                    return f"{os_info['NAME']} {version}".strip()
-        except Exception:
-            pass
-        
         # 方法3: 读取 /etc/lsb-release (Ubuntu 等)
         try:
-            with open("/etc/lsb-release") as f:
-                for line in f:
-                    if line.startswith("DISTRIB_DESCRIPTION="):
-                        return line.split("=", 1)[1].strip().strip('"')
+            with open("/etc/lsb-release", encoding="utf-8", errors="replace") as f:
+                match = _LSB_DESCRIPTION_RE.search(f.read())
+            if match:
+                return match.group(1).strip().strip('"')
         except Exception:
             pass
         
         # 方法4: 检查特定发行版文件
         distro_files = [
-            ("/etc/redhat-release", None),
-            ("/etc/centos-release", None),
-            ("/etc/fedora-release", None),
-            ("/etc/debian_version", "Debian"),
-            ("/etc/arch-release", "Arch Linux"),
-            ("/etc/gentoo-release", None),
-            ("/etc/SuSE-release", None),
-            ("/etc/slackware-version", None),
+            ("redhat-release", None),
+            ("centos-release", None),
+            ("fedora-release", None),
+            ("debian_version", "Debian"),
+            ("arch-release", "Arch Linux"),
+            ("gentoo-release", None),
+            ("SuSE-release", None),
+            ("slackware-version", None),
         ]
         
-        for filepath, prefix in distro_files:
+        # 一次遍历 /etc, 只打开确实存在的文件
+        try:
+            with os.scandir("/etc") as it:
+                existing = {entry.name for entry in it if entry.is_file()}
+        except OSError:
+            existing = set()
+        
+        for filename, prefix in distro_files:
+            if filename not in existing:
+                continue
             try:
-                with open(filepath) as f:
+                with open(os.path.join("/etc", filename)) as f:
                     content = f.read().strip()
                     if prefix:
                         return f"{prefix} {content}"
@@ -242,24 +848,27 @@ class SystemDetector:
                 continue
         
         # 方法5: 使用 uname
-        return f"Linux {platform.release()}"
+        return f"Linux {_uname().release}"
     
     def _detect_host(self, info: SystemInfo) -> None:
         """检测主机信息"""
-        info.hostname = socket.gethostname()
-        try:
-            info.fqdn = socket.getfqdn()
-        except Exception:
-            info.fqdn = info.hostname
+        hostname = socket.gethostname()
+        info.hostname = hostname
+        
+        if "." in hostname:
+            # 主机名已是完整域名, 无需反向解析
+            info.fqdn = hostname
+        else:
+            fqdn = self._fqdn_cache.get(hostname)
+            if fqdn is None:
+                fqdn = self._fqdn_cache[hostname] = _resolve_fqdn(hostname)
+            info.fqdn = fqdn
         
         # 获取机器 ID
-        try:
-            info.machine_id = str(uuid.getnode())
-        except Exception:
-            info.machine_id = "unknown"
+        info.machine_id = _read_machine_id()
     
     def _detect_hardware(self, info: SystemInfo) -> None:
-        """检测硬件信息"""
+        """检测硬件信息 (CPU; 内存由 _detect_memory 单独检测)"""
         # CPU 信息
         info.cpu_name = self._get_cpu_name()
         
@@ -269,76 +878,27 @@ class SystemDetector:
             info.cpu_threads = info.cpu_cores
             
             # 尝试获取物理核心数
-            try:
-                import psutil
+            if PSUTIL_AVAILABLE:
                 info.cpu_cores = psutil.cpu_count(logical=False) or info.cpu_cores
                 info.cpu_threads = psutil.cpu_count(logical=True) or info.cpu_threads
-            except ImportError:
-                pass
         except Exception:
             info.cpu_cores = 1
             info.cpu_threads = 1
-        
-        # 内存信息
-        self._detect_memory(info)
     
     def _get_cpu_name(self) -> str:
         """获取 CPU 名称"""
-        cpu_name = platform.processor()
-        if cpu_name:
-            return cpu_name
-        
-        system = platform.system()
-        
-        # Linux: 从 /proc/cpuinfo 获取
-        if system == "Linux":
-            try:
-                with open("/proc/cpuinfo") as f:
-                    for line in f:
-                        if line.startswith("model name"):
-                            return line.split(":", 1)[1].strip()
-            except Exception:
-                pass
-        
-        # macOS: 使用 sysctl
-        elif system == "Darwin":
-            try:
-                result = subprocess.run(
-                    ["sysctl", "-n", "machdep.cpu.brand_string"],
-                    capture_output=True, text=True, timeout=5
-                )
-                if result.returncode == 0:
-                    return result.stdout.strip()
-            except Exception:
-                pass
-        
-        # BSD: 使用 sysctl
-        elif system in ("FreeBSD", "OpenBSD", "NetBSD"):
-            try:
-                result = subprocess.run(
-                    ["sysctl", "-n", "hw.model"],
-                    capture_output=True, text=True, timeout=5
-                )
-                if result.returncode == 0:
-                    return result.stdout.strip()
-            except Exception:
-                pass
-        
-        return "Unknown CPU"
+        return _read_cpu_name()
     
     def _detect_memory(self, info: SystemInfo) -> None:
         """检测内存信息"""
         # 方法1: 使用 psutil
-        try:
-            import psutil
+        if PSUTIL_AVAILABLE:
             mem = psutil.virtual_memory()
             info.memory_total_gb = round(mem.total / (1024**3), 2)
             info.memory_available_gb = round(mem.available / (1024**3), 2)
             return
-        except ImportError:
-            pass
         
-        system = platform.system()
+        system = _uname().system
         
         # 方法2: Windows 专用
         if system == "Windows":
@@ -370,39 +930,40 @@ class SystemDetector:
             except Exception:
                 pass
         
-        # 方法3: Linux - 读取 /proc/meminfo
+        # 方法3: Linux - 总内存用 sysconf, 可用内存读取 /proc/meminfo
         elif system == "Linux":
             try:
-                with open("/proc/meminfo") as f:
-                    mem_info = {}
-                    for line in f:
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            key = parts[0].rstrip(":")
-                            value = int(parts[1])  # KB
-                            mem_info[key] = value
-                    
-                    if "MemTotal" in mem_info:
-                        info.memory_total_gb = round(mem_info["MemTotal"] / (1024**2), 2)
-                    if "MemAvailable" in mem_info:
-                        info.memory_available_gb = round(mem_info["MemAvailable"] / (1024**2), 2)
-                    elif "MemFree" in mem_info:
-                        # 老版本内核没有 MemAvailable
-                        info.memory_available_gb = round(mem_info["MemFree"] / (1024**2), 2)
-                    return
+                total_bytes = os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+                info.memory_total_gb = round(total_bytes / (1024**3), 2)
+            except (ValueError, OSError, AttributeError):
+                pass
+            try:
+                with open("/proc/meminfo", "rb") as f:
+                    # MemTotal/MemFree/MemAvailable 位于文件开头几行
+                    data = f.read(256)
+                    if b"MemAvailable" not in data:
+                        data += f.read()
+                # 只提取需要的三项 (单位 KB)
+                mem_info = {key: int(value) for key, value in _MEMINFO_RE.findall(data)}
+                
+                if not info.memory_total_gb and b"MemTotal" in mem_info:
+                    info.memory_total_gb = round(mem_info[b"MemTotal"] / (1024**2), 2)
+                if b"MemAvailable" in mem_info:
+                    info.memory_available_gb = round(mem_info[b"MemAvailable"] / (1024**2), 2)
+                elif b"MemFree" in mem_info:
+                    # 老版本内核没有 MemAvailable
+                    info.memory_available_gb = round(mem_info[b"MemFree"] / (1024**2), 2)
+                return
             except Exception:
                 pass
         
-        # 方法4: macOS/BSD - 使用 sysctl
-        elif system in ("Darwin", "FreeBSD", "OpenBSD", "NetBSD"):
+        # 方法4: macOS/BSD - 使用 sysctl (与 CPU 型号共用一次调用)
+        elif system in SYSCTL_KEYS:
             try:
                 # 获取总内存
-                result = subprocess.run(
-                    ["sysctl", "-n", "hw.memsize" if system == "Darwin" else "hw.physmem"],
-                    capture_output=True, text=True, timeout=5
-                )
-                if result.returncode == 0:
-                    total_bytes = int(result.stdout.strip())
+                value = _sysctl_values().get("hw.memsize" if system == "Darwin" else "hw.physmem")
+                if value:
+                    total_bytes = int(value)
                     info.memory_total_gb = round(total_bytes / (1024**3), 2)
                     # BSD 系统获取可用内存比较复杂，这里简化处理
                     info.memory_available_gb = info.memory_total_gb * 0.5  # 估算值
@@ -412,14 +973,14 @@ class SystemDetector:
     
     def _detect_python(self, info: SystemInfo) -> None:
         """检测 Python 环境"""
-        info.python_version = platform.python_version()
-        info.python_implementation = platform.python_implementation()
+        info.python_version = _platform_value("python_version")
+        info.python_implementation = _platform_value("python_implementation")
         info.python_path = sys.executable
         
         # 检测虚拟环境
-        info.virtual_env = os.environ.get("VIRTUAL_ENV", "")
+        info.virtual_env = _env_value("VIRTUAL_ENV")
         if not info.virtual_env:
-            info.virtual_env = os.environ.get("CONDA_DEFAULT_ENV", "")
+            info.virtual_env = _env_value("CONDA_DEFAULT_ENV")
         if not info.virtual_env:
             # 检查是否在 venv 中
             if hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix):
@@ -427,94 +988,107 @@ class SystemDetector:
     
     def _detect_network(self, info: SystemInfo) -> None:
         """检测网络信息"""
+        self._detect_interfaces(info)
+        self._detect_dns(info)
+    
+    def _detect_interfaces(self, info: SystemInfo) -> None:
+        """检测网络接口"""
         interfaces = []
         
-        try:
-            import psutil
-            
+        if PSUTIL_AVAILABLE:
             # 获取网络接口信息
             addrs = psutil.net_if_addrs()
             stats = psutil.net_if_stats()
             
+            # 循环中使用的常量预先取到局部变量
+            af_inet = socket.AF_INET
+            af_inet6 = socket.AF_INET6
+            af_link = psutil.AF_LINK
+            ip_families = (af_inet, af_inet6)
+            
             for name, addr_list in addrs.items():
-                iface = NetworkInterface(name=name)
+                stat = stats.get(name)
+                # 跳过已关闭的接口和回环/虚拟接口, 不再为其整理地址
+                if stat is not None and not stat.isup:
+                    continue
+                if name.startswith(VIRTUAL_IFACE_PREFIXES):
+                    continue
+                # 只统计有 IP 地址的接口
+                if not any(addr.family in ip_families for addr in addr_list):
+                    continue
                 
-                for addr in addr_list:
-                    if addr.family == socket.AF_INET:
-                        iface.ipv4_addresses.append(addr.address)
-                    elif addr.family == socket.AF_INET6:
-                        iface.ipv6_addresses.append(addr.address)
-                    elif addr.family == psutil.AF_LINK:
-                        iface.mac_address = addr.address
+                ipv4_addresses = []
+                ipv6_addresses = []
+                mac_address = ""
                 
-                if name in stats:
-                    iface.is_up = stats[name].isup
-                    iface.mtu = stats[name].mtu
+                # 地址族 -> 收集函数, 一次字典查找代替逐个比较
+                dispatch = {
+                    af_inet: ipv4_addresses.append,
+                    af_inet6: ipv6_addresses.append,
+                }
+                for addr in addr_list:
+                    append = dispatch.get(addr.family)
+                    if append is not None:
+                        append(addr.address)
+                    elif addr.family == af_link:
+                        mac_address = addr.address
                 
-                # 只添加有 IP 地址的接口
-                if iface.ipv4_addresses or iface.ipv6_addresses:
-                    interfaces.append(iface)
-            
-            # 获取默认网关
-            gws = psutil.net_if_stats()
-            
-        except ImportError:
+                interfaces.append(NetworkInterface(
+                    name=name,
+                    mac_address=mac_address,
+                    ipv4_addresses=tuple(ipv4_addresses),
+                    ipv6_addresses=tuple(ipv6_addresses),
+                    is_up=stat.isup if stat is not None else False,
+                    mtu=stat.mtu if stat is not None else 0,
+                ))
+        else:
             # 备用方案：使用 socket 获取本机 IP
-            try:
-                s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                s.connect(("8.8.8.8", 80))
-                local_ip = s.getsockname()[0]
-                s.close()
-                
+            local_ip = _probe_local_ip()
+            if local_ip:
                 iface = NetworkInterface(
                     name="default",
-                    ipv4_addresses=[local_ip],
+                    ipv4_addresses=(local_ip,),
                     is_up=True
                 )
                 interfaces.append(iface)
-            except Exception:
-                pass
         
         info.network_interfaces = interfaces
         
-        # 获取 DNS 服务器
+        # 默认网关 (目前仅 Linux)
+        info.default_gateway = _read_default_gateway()
+    
+    def _detect_dns(self, info: SystemInfo) -> None:
+        """检测 DNS 服务器"""
         info.dns_servers = self._get_dns_servers()
     
     def _get_dns_servers(self) -> List[str]:
-        """获取 DNS 服务器列表"""
+        """获取 DNS 服务器列表 (结果缓存 DNS_CACHE_TTL 秒)"""
+        return list(_cached_dns_servers(int(time.monotonic() // DNS_CACHE_TTL)))
+    
+    @staticmethod
+    def _probe_dns_servers() -> List[str]:
+        """探测 DNS 服务器列表 (可能启动子进程)"""
         dns_servers = []
         
-        system = platform.system()
+        system = _uname().system
         
         if system == "Windows":
+            # 直接调用 iphlpapi: 优先按适配器获取 (含 IPv6), 失败时使用全局参数
             try:
-                result = subprocess.run(
-                    ["ipconfig", "/all"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                    encoding='gbk',
-                    errors='ignore'
-                )
-                for line in result.stdout.split("\n"):
-                    if "DNS" in line and ":" in line:
-                        parts = line.split(":")
-                        if len(parts) >= 2:
-                            ip = parts[-1].strip()
-                            if ip and ip[0].isdigit():
-                                dns_servers.append(ip)
-            except Exception:
-                pass
+                dns_servers = SystemDetector._get_windows_dns_servers()
+            except Exception as e:
+                logger.debug(f"GetAdaptersAddresses 调用失败: {e}")
+            
+            if not dns_servers:
+                try:
+                    dns_servers = SystemDetector._get_windows_network_params_dns()
+                except Exception as e:
+                    logger.debug(f"GetNetworkParams 调用失败: {e}")
         else:
             # Linux/macOS/BSD: 读取 /etc/resolv.conf
             try:
-                with open("/etc/resolv.conf") as f:
-                    for line in f:
-                        line = line.strip()
-                        if line.startswith("nameserver"):
-                            parts = line.split()
-                            if len(parts) >= 2:
-                                dns_servers.append(parts[1])
+                with open(RESOLV_CONF, encoding="utf-8", errors="replace") as f:
+                    dns_servers = _NAMESERVER_RE.findall(f.read())
             except Exception:
                 pass
             
@@ -536,95 +1110,313 @@ class SystemDetector:
                 except Exception:
                     pass
         
-        # 去重并返回前 5 个
-        seen = set()
-        unique_servers = []
-        for server in dns_servers:
-            if server not in seen:
-                seen.add(server)
-                unique_servers.append(server)
+        # 去重 (保持顺序) 并返回前 5 个
+        return list(dict.fromkeys(dns_servers))[:5]
+    
+    @staticmethod
+    def _get_windows_dns_servers() -> List[str]:
+        """
+        通过 iphlpapi.GetAdaptersAddresses 获取 Windows DNS 服务器
+        
+        进程内 API 调用, 无需启动 ipconfig 子进程, 也不依赖本地化输出文本。
+        只统计已连接 (OperStatus 为 Up) 的适配器。
+        
+        Returns:
+            DNS 服务器地址列表
+        """
+        import ctypes
+        from ctypes import wintypes
+        
+        class _SocketAddress(ctypes.Structure):
+            _fields_ = [
+                ("lpSockaddr", ctypes.c_void_p),
+                ("iSockaddrLength", ctypes.c_int),
+            ]
+        
+        class _IpAdapterDnsServerAddress(ctypes.Structure):
+            pass
+        
+        _IpAdapterDnsServerAddress._fields_ = [
+            ("Length", wintypes.ULONG),
+            ("Reserved", wintypes.DWORD),
+            ("Next", ctypes.POINTER(_IpAdapterDnsServerAddress)),
+            ("Address", _SocketAddress),
+        ]
+        
+        # 只声明到 OperStatus 为止的前缀字段 (结构体由系统分配, 无需完整定义)
+        class _IpAdapterAddresses(ctypes.Structure):
+            pass
+        
+        _IpAdapterAddresses._fields_ = [
+            ("Length", wintypes.ULONG),
+            ("IfIndex", wintypes.DWORD),
+            ("Next", ctypes.POINTER(_IpAdapterAddresses)),
+            ("AdapterName", ctypes.c_char_p),
+            ("FirstUnicastAddress", ctypes.c_void_p),
+            ("FirstAnycastAddress", ctypes.c_void_p),
+            ("FirstMulticastAddress", ctypes.c_void_p),
+            ("FirstDnsServerAddress", ctypes.POINTER(_IpAdapterDnsServerAddress)),
+            ("DnsSuffix", ctypes.c_wchar_p),
+            ("Description", ctypes.c_wchar_p),
+            ("FriendlyName", ctypes.c_wchar_p),
+            ("PhysicalAddress", ctypes.c_ubyte * 8),
+            ("PhysicalAddressLength", wintypes.ULONG),
+            ("Flags", wintypes.ULONG),
+            ("Mtu", wintypes.ULONG),
+            ("IfType", wintypes.DWORD),
+            ("OperStatus", ctypes.c_int),
+        ]
+        
+        get_adapters = ctypes.windll.iphlpapi.GetAdaptersAddresses
+        flags = (
+            _GAA_FLAG_SKIP_UNICAST | _GAA_FLAG_SKIP_ANYCAST
+            | _GAA_FLAG_SKIP_MULTICAST | _GAA_FLAG_SKIP_FRIENDLY_NAME
+        )
+        
+        # 缓冲区不足时按系统返回的大小重试
+        size = wintypes.ULONG(15 * 1024)
+        for _ in range(3):
+            buf = ctypes.create_string_buffer(size.value)
+            ret = get_adapters(_AF_UNSPEC, flags, None, buf, ctypes.byref(size))
+            if ret != _ERROR_BUFFER_OVERFLOW:
+                break
+        if ret != _ERROR_SUCCESS:
+            raise OSError(ret, "GetAdaptersAddresses failed")
+        
+        servers = []
+        adapter = ctypes.cast(buf, ctypes.POINTER(_IpAdapterAddresses))
+        while adapter:
+            if adapter.contents.OperStatus == _IF_OPER_STATUS_UP:
+                dns = adapter.contents.FirstDnsServerAddress
+                while dns:
+                    address = dns.contents.Address
+                    raw = ctypes.string_at(address.lpSockaddr, address.iSockaddrLength)
+                    family = int.from_bytes(raw[:2], "little")
+                    if family == socket.AF_INET:
+                        servers.append(socket.inet_ntop(socket.AF_INET, raw[4:8]))
+                    elif family == socket.AF_INET6:
+                        ip = socket.inet_ntop(socket.AF_INET6, raw[8:24])
+                        # 跳过 Windows 默认填充的 fec0:0:0:ffff::1~3 站点本地占位地址
+                        if not ip.startswith("fec0:0:0:ffff::"):
+                            servers.append(ip)
+                    dns = dns.contents.Next
+            adapter = adapter.contents.Next
+        
+        return servers
+    
+    @staticmethod
+    def _get_windows_network_params_dns() -> List[str]:
+        """
+        通过 iphlpapi.GetNetworkParams 获取 Windows 全局 DNS 服务器 (仅 IPv4)
+        
+        Returns:
+            DNS 服务器地址列表
+        """
+        import ctypes
+        from ctypes import wintypes
+        
+        class _IpAddrString(ctypes.Structure):
+            pass
+        
+        _IpAddrString._fields_ = [
+            ("Next", ctypes.POINTER(_IpAddrString)),
+            ("IpAddress", ctypes.c_char * 16),
+            ("IpMask", ctypes.c_char * 16),
+            ("Context", wintypes.DWORD),
+        ]
+        
+        class _FixedInfo(ctypes.Structure):
+            _fields_ = [
+                ("HostName", ctypes.c_char * (_MAX_HOSTNAME_LEN + 4)),
+                ("DomainName", ctypes.c_char * (_MAX_DOMAIN_NAME_LEN + 4)),
+                ("CurrentDnsServer", ctypes.POINTER(_IpAddrString)),
+                ("DnsServerList", _IpAddrString),
+                ("NodeType", wintypes.UINT),
+                ("ScopeId", ctypes.c_char * (_MAX_SCOPE_ID_LEN + 4)),
+                ("EnableRouting", wintypes.UINT),
+                ("EnableProxy", wintypes.UINT),
+                ("EnableDns", wintypes.UINT),
+            ]
+        
+        get_params = ctypes.windll.iphlpapi.GetNetworkParams
+        
+        # 先查询所需缓冲区大小, 再按该大小调用
+        size = wintypes.ULONG(ctypes.sizeof(_FixedInfo))
+        for _ in range(3):
+            buf = ctypes.create_string_buffer(size.value)
+            ret = get_params(buf, ctypes.byref(size))
+            if ret != _ERROR_BUFFER_OVERFLOW:
+                break
+        if ret != _ERROR_SUCCESS:
+            raise OSError(ret, "GetNetworkParams failed")
         
-        return unique_servers[:5]
+        servers = []
+        fixed_info = ctypes.cast(buf, ctypes.POINTER(_FixedInfo)).contents
+        entry = ctypes.pointer(fixed_info.DnsServerList)
+        while entry:
+            ip = entry.contents.IpAddress.decode("ascii", "ignore")
+            if ip:
+                servers.append(ip)
+            entry = entry.contents.Next
+        
+        return servers
     
     def _detect_time(self, info: SystemInfo) -> None:
         """检测时间信息"""
-        import time
-        
-        info.current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # 时间与时区取自同一时刻 (夏令时期间 tm_zone 为夏令时名称)
+        now = time.localtime()
+        info.current_time = time.strftime("%Y-%m-%d %H:%M:%S", now)
         
         # 时区
         try:
-            info.timezone = time.tzname[0]
+            info.timezone = now.tm_zone or time.tzname[0]
         except Exception:
             info.timezone = "Unknown"
         
         # 系统运行时间
-        try:
-            import psutil
-            boot_time = datetime.fromtimestamp(psutil.boot_time())
-            uptime = datetime.now() - boot_time
-            days = uptime.days
-            hours, remainder = divmod(uptime.seconds, 3600)
-            minutes, _ = divmod(remainder, 60)
+        uptime = _uptime_seconds()
+        if uptime is not None:
+            days, remainder = divmod(uptime, 86400)
+            hours, remainder = divmod(remainder, 3600)
+            minutes = remainder // 60
             info.uptime = f"{days}天 {hours}小时 {minutes}分钟"
-        except ImportError:
+        else:
             info.uptime = "未知"
 
 
+@lru_cache(maxsize=1)
+def _cached_dns_servers(bucket: int) -> Tuple[str, ...]:
+    """
+    按时间分桶缓存 DNS 服务器探测结果
+    
+    bucket 为 time.monotonic() // DNS_CACHE_TTL, 同一时间段内直接返回缓存,
+    进入下一时间段时重新探测。
+    """
+    return tuple(SystemDetector._probe_dns_servers())
+
+
 # 全局检测器实例
 _detector: Optional[SystemDetector] = None
+_detector_lock = threading.Lock()
+
+
+def _get_detector() -> SystemDetector:
+    """获取全局检测器 (双重检查, 并发首次调用时也只创建一个实例)"""
+    global _detector
+    
+    detector = _detector
+    if detector is None:
+        with _detector_lock:
+            if _detector is None:
+                _detector = SystemDetector()
+            detector = _detector
+    return detector
 
 
-def get_system_info(refresh: bool = False) -> SystemInfo:
+def _clear_probe_caches() -> None:
+    """清除按有效期缓存的探测结果 (DNS 服务器、本机 IP), 强制刷新时调用"""
+    global _local_ip_cache
+    
+    _cached_dns_servers.cache_clear()
+    _local_ip_cache = None
+
+
+def get_system_info(
+    refresh: bool = False,
+    probes: Optional[Collection[str]] = None,
+) -> SystemInfo:
     """
     获取系统信息
     
     Args:
         refresh: 是否强制刷新
+        probes: 需要保持新鲜的动态检测项, None 表示全部 (见 SystemDetector.detect)
         
     Returns:
         SystemInfo 对象
     """
-    global _detector
+    return _get_detector().detect(refresh=refresh, probes=probes)
+
+
+# 系统信息摘要模板 (可选行按条件拼接)
+_SUMMARY_HEAD = (
+    "操作系统: {os_name}\n"
+    "系统架构: {os_arch}\n"
+    "主机名: {hostname}\n"
+    "CPU: {cpu_name} ({cpu_cores}核/{cpu_threads}线程)\n"
+    "内存: {memory_available_gb:.1f} GB / {memory_total_gb:.1f} GB\n"
+    "Python: {python_version} ({python_implementation})"
+)
+_SUMMARY_VENV = "\n虚拟环境: {virtual_env}"
+_SUMMARY_IP = "\nIP 地址: {ip_address}"
+_SUMMARY_TIME = "\n系统时间: {current_time}"
+_SUMMARY_UPTIME = "\n运行时间: {uptime}"
+
+# 摘要用到的动态信息 (不刷新 DNS 服务器)
+_SUMMARY_PROBES = frozenset({"_detect_memory", "_detect_interfaces", "_detect_time"})
+
+# 上次生成的摘要: (SystemInfo, 可用内存, 系统时间, 摘要文本)
+_summary_cache: Optional[tuple] = None
+
+
+class _InfoFields(dict):
+    """format_map() 用的字段映射: 未显式提供的键从 SystemInfo 属性读取"""
+    
+    __slots__ = ("_info",)
     
-    if _detector is None:
-        _detector = SystemDetector()
+    def __init__(self, info: SystemInfo, **extra: Any):
+        super().__init__(extra)
+        self._info = info
     
-    return _detector.detect(refresh=refresh)
+    def __missing__(self, key: str) -> Any:
+        return getattr(self._info, key)
+
+
+@lru_cache(maxsize=None)
+def _summary_template(has_venv: bool, has_ip: bool, has_uptime: bool) -> str:
+    """按可选行的组合拼接摘要模板 (每种组合只拼接一次)"""
+    return "".join((
+        _SUMMARY_HEAD,
+        _SUMMARY_VENV if has_venv else "",
+        _SUMMARY_IP if has_ip else "",
+        _SUMMARY_TIME,
+        _SUMMARY_UPTIME if has_uptime else "",
+    ))
 
 
 def get_system_summary() -> str:
     """
     获取系统信息摘要（用于显示）
     
+    同一 SystemInfo 的可用内存和系统时间未变化时直接返回上次的结果。
+    
     Returns:
         格式化的系统信息字符串
     """
-    info = get_system_info()
-    
-    lines = [
-        f"操作系统: {info.os_name}",
-        f"系统架构: {info.os_arch}",
-        f"主机名: {info.hostname}",
-        f"CPU: {info.cpu_name} ({info.cpu_cores}核/{info.cpu_threads}线程)",
-        f"内存: {info.memory_available_gb:.1f} GB / {info.memory_total_gb:.1f} GB",
-        f"Python: {info.python_version} ({info.python_implementation})",
-    ]
+    global _summary_cache
     
-    if info.virtual_env:
-        lines.append(f"虚拟环境: {info.virtual_env}")
+    info = get_system_info(probes=_SUMMARY_PROBES)
+    cached = _summary_cache
+    if (
+        cached is not None
+        and cached[0] is info
+        and cached[1] == info.memory_available_gb
+        and cached[2] == info.current_time
+    ):
+        return cached[3]
     
+    ip_address = ""
     if info.network_interfaces:
-        iface = info.network_interfaces[0]
-        if iface.ipv4_addresses:
-            lines.append(f"IP 地址: {iface.ipv4_addresses[0]}")
-    
-    lines.append(f"系统时间: {info.current_time}")
-    
-    if info.uptime != "未知":
-        lines.append(f"运行时间: {info.uptime}")
+        ipv4_addresses = info.network_interfaces[0].ipv4_addresses
+        if ipv4_addresses:
+            ip_address = ipv4_addresses[0]
     
-    return "\n".join(lines)
+    template = _summary_template(
+        bool(info.virtual_env), bool(ip_address), info.uptime != "未知"
+    )
+    summary = template.format_map(_InfoFields(info, ip_address=ip_address))
+    _summary_cache = (info, info.memory_available_gb, info.current_time, summary)
+    return summary
 
 
 __all__ = [
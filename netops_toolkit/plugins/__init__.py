@@ -12,6 +12,8 @@ from .base import (
     ParamSpec,
     register_plugin,
     get_registered_plugins,
+    get_registered_plugins_for,
+    get_registry_version,
 )
 
 __all__ = [
@@ -22,4 +24,6 @@ __all__ = [
     "ParamSpec",
     "register_plugin",
     "get_registered_plugins",
+    "get_registered_plugins_for",
+    "get_registry_version",
 ]
@@ -12,12 +12,23 @@ from typing import Any, Dict, List, Optional, Tuple, Type
 
 
 class PluginCategory(str, Enum):
-    """插件分类枚举"""
-    DIAGNOSTICS = "diagnostics"      # 诊断工具
-    DEVICE_MGMT = "device_mgmt"      # 设备管理
-    SCANNING = "scanning"            # 网络扫描
-    PERFORMANCE = "performance"      # 性能测试
-    UTILS = "utils"                  # 实用工具
+    """
+    插件分类枚举
+    
+    成员值为分类标识字符串, 并附带菜单图标 (icon) 和显示名称 (display_name)。
+    """
+    DIAGNOSTICS = ("diagnostics", "🔍", "诊断工具")
+    DEVICE_MGMT = ("device_mgmt", "🖥️", "设备管理")
+    SCANNING = ("scanning", "📡", "网络扫描")
+    PERFORMANCE = ("performance", "⚡", "性能测试")
+    UTILS = ("utils", "🛠️", "实用工具")
+    
+    def __new__(cls, value: str, icon: str = "•", display_name: str = ""):
+        obj = str.__new__(cls, value)
+        obj._value_ = value
+        obj.icon = icon
+        obj.display_name = display_name or value
+        return obj
 
 
 class ResultStatus(str, Enum):
@@ -90,6 +101,26 @@ class ParamSpec:
     required: bool = True
     default: Any = None
     choices: Optional[List[Any]] = None
+    # 预计算的可选值集合, 校验时 O(1) 查找
+    _choices_set: Optional[frozenset] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        if self.choices:
+            try:
+                self._choices_set = frozenset(self.choices)
+            except TypeError:
+                # 可选值不可哈希时退回列表扫描
+                self._choices_set = None
+    
+    def is_valid_choice(self, value: Any) -> bool:
+        """检查值是否在可选值范围内 (未限定可选值时始终为 True)"""
+        if not self.choices:
+            return True
+        if self._choices_set is not None:
+            return value in self._choices_set
+        return value in self.choices
 
 
 class Plugin(ABC):
@@ -202,22 +233,18 @@ class Plugin(ABC):
         """
         self._initialized = False
     
-    def get_menu_title(self) -> str:
+    @classmethod
+    def get_menu_title(cls) -> str:
         """
         获取菜单显示标题
         
+        只读取类属性, 无需实例化插件即可调用。
+        
         Returns:
             带图标的菜单标题
         """
-        icons = {
-            PluginCategory.DIAGNOSTICS: "🔍",
-            PluginCategory.DEVICE_MGMT: "🖥️",
-            PluginCategory.SCANNING: "📡",
-            PluginCategory.PERFORMANCE: "⚡",
-            PluginCategory.UTILS: "🛠️",
-        }
-        icon = icons.get(self.category, "•")
-        return f"{icon} {self.name}"
+        icon = cls.category.icon
+        return f"{icon} {cls.name}"
     
     def __repr__(self) -> str:
         return f"<Plugin: {self.name} v{self.version}>"
@@ -226,6 +253,12 @@ class Plugin(ABC):
 # 插件注册表
 _plugin_registry: Dict[str, Type[Plugin]] = {}
 
+# 按分类索引的插件注册表 (注册时维护)
+_category_index: Dict[PluginCategory, List[Type[Plugin]]] = {}
+
+# 注册表版本号 (每次注册递增, 供调用方判断缓存是否失效)
+_registry_version: int = 0
+
 
 def register_plugin(plugin_class: Type[Plugin]) -> Type[Plugin]:
     """
@@ -236,7 +269,20 @@ def register_plugin(plugin_class: Type[Plugin]) -> Type[Plugin]:
         class MyPlugin(Plugin):
             ...
     """
+    global _registry_version
+    bucket = _category_index.setdefault(plugin_class.category, [])
+    previous = _plugin_registry.get(plugin_class.name)
+    
+    # 同名插件重复注册时替换原有条目, 保持注册顺序
+    if previous is not None and previous.category == plugin_class.category:
+        bucket[bucket.index(previous)] = plugin_class
+    else:
+        if previous is not None:
+            _category_index[previous.category].remove(previous)
+        bucket.append(plugin_class)
+    
     _plugin_registry[plugin_class.name] = plugin_class
+    _registry_version += 1
     return plugin_class
 
 
@@ -245,6 +291,24 @@ def get_registered_plugins() -> Dict[str, Type[Plugin]]:
     return _plugin_registry.copy()
 
 
+def get_registered_plugins_for(category: PluginCategory) -> List[Type[Plugin]]:
+    """
+    获取指定分类下已注册的插件
+    
+    Args:
+        category: 插件分类
+        
+    Returns:
+        插件类列表
+    """
+    return list(_category_index.get(category, ()))
+
+
+def get_registry_version() -> int:
+    """获取插件注册表版本号"""
+    return _registry_version
+
+
 __all__ = [
     "Plugin",
     "PluginCategory",
@@ -253,4 +317,6 @@ __all__ = [
     "ParamSpec",
     "register_plugin",
     "get_registered_plugins",
+    "get_registered_plugins_for",
+    "get_registry_version",
 ]
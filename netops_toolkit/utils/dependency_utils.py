@@ -4,6 +4,7 @@
 提供插件依赖检测和自动安装功能。
 """
 
+import importlib
 import subprocess
 import sys
 from dataclasses import dataclass
@@ -102,6 +103,8 @@ def install_dependency(dependency: DependencyInfo, upgrade: bool = False) -> Tup
         )
         
         if result.returncode == 0:
+            # 刷新导入系统的路径缓存, 使后续导入能发现新安装的包
+            importlib.invalidate_caches()
             logger.info(f"依赖安装成功: {package_spec}")
             return True, f"成功安装 {package_spec}"
         else:
@@ -0,0 +1,44 @@
+"""
+设备清单模块测试
+"""
+
+import pytest
+
+from netops_toolkit.config import yaml_loader
+from netops_toolkit.config.device_inventory import DeviceInventory
+
+INVENTORY = """\
+groups:
+  core:
+    vendor: cisco_ios
+    devices:
+      - name: sw1
+        ip: 10.0.0.1
+        tags:
+      - name: sw2
+        ip: 10.0.0.2
+        tags: core
+standalone_devices:
+  - name: fw1
+    ip: 10.0.0.254
+    tags: [edge, fw]
+"""
+
+
+@pytest.fixture
+def inventory(tmp_path, monkeypatch):
+    """从临时文件加载设备清单 (解析缓存写入临时目录)"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    yaml_loader._cache_dir.cache_clear()
+    path = tmp_path / "devices.yaml"
+    path.write_text(INVENTORY, encoding="utf-8")
+    yield DeviceInventory(path)
+    yaml_loader._cache_dir.cache_clear()
+
+
+def test_tags_empty_or_scalar(inventory):
+    """空 tags 视为无标签, 单个字符串视为一个标签, 不影响其他设备加载"""
+    assert inventory.get_device("sw1").tags == ()
+    assert inventory.get_device("sw2").tags == ("core",)
+    assert inventory.get_device("fw1").tags == ("edge", "fw")
+    assert [d.name for d in inventory.get_devices_by_tag("core")] == ["sw2"]
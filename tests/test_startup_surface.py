@@ -0,0 +1,56 @@
+"""
+启动导入面测试
+
+导入包和 --version / --help 快速路径不应加载 CLI 命令树、第三方UI库或 YAML 解析器。
+每个用例在独立子进程中运行, 不受测试进程已导入模块的影响。
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 快速路径禁止导入的模块
+HEAVY_MODULES = ("typer", "rich", "questionary", "yaml", "netops_toolkit.cli")
+
+_IMPORT_ONLY = "import netops_toolkit"
+_RUN_MAIN = (
+    "import runpy; sys.argv = ['netops_toolkit', {flag!r}]; "
+    "runpy.run_module('netops_toolkit', run_name='__main__')"
+)
+
+
+def _loaded_heavy_modules(code: str) -> list:
+    """在子进程中执行代码, 返回其中已导入的重量级模块"""
+    script = (
+        f"import json, sys\n{code}\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    env = dict(os.environ)
+    env.pop("NETOPS_EAGER_IMPORT", None)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=str(ROOT),
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_import_package():
+    """导入包本身不加载任何重量级模块"""
+    assert _loaded_heavy_modules(_IMPORT_ONLY) == []
+
+
+@pytest.mark.parametrize("flag", ["--version", "--help"])
+def test_fast_path(flag):
+    """--version / --help 走快速路径, 不加载 CLI"""
+    assert _loaded_heavy_modules(_RUN_MAIN.format(flag=flag)) == []
@@ -0,0 +1,64 @@
+"""
+系统信息检测测试
+"""
+
+import socket
+
+import pytest
+
+from netops_toolkit.core.system_info import (
+    NetworkInterface,
+    SystemDetector,
+    SystemInfo,
+    _read_machine_id,
+)
+
+STALE_IFACE = NetworkInterface(name="eth9", ipv4_addresses=("10.99.99.99",))
+FRESH_IFACE = NetworkInterface(name="eth0", ipv4_addresses=("192.0.2.10",))
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    """将磁盘缓存重定向到临时目录, 并固定网络检测结果"""
+    path = tmp_path / "system_info.json"
+    monkeypatch.setattr(SystemDetector, "_cache_file", staticmethod(lambda: path))
+
+    def fake_interfaces(self, info):
+        info.network_interfaces = [FRESH_IFACE]
+
+    def fake_dns(self, info):
+        info.dns_servers = ["192.0.2.53"]
+
+    monkeypatch.setattr(SystemDetector, "_detect_interfaces", fake_interfaces)
+    monkeypatch.setattr(SystemDetector, "_detect_dns", fake_dns)
+    return path
+
+
+def _write_stale_cache(hostname: str) -> None:
+    """写入带有过时网络信息的缓存"""
+    info = SystemInfo(
+        hostname=hostname,
+        machine_id=_read_machine_id(),
+        network_interfaces=[STALE_IFACE],
+        dns_servers=["9.9.9.9"],
+    )
+    SystemDetector()._save_cache(info)
+
+
+def test_cache_hit_reprobes_network(cache_file):
+    """缓存命中时网络接口和 DNS 应重新检测, 而不是直接使用缓存内容"""
+    _write_stale_cache(socket.gethostname())
+
+    detector = SystemDetector()
+    assert detector._load_cache() is not None
+    info = detector.detect()
+
+    assert info.network_interfaces == [FRESH_IFACE]
+    assert info.dns_servers == ["192.0.2.53"]
+
+
+def test_cache_rejected_when_hostname_changed(cache_file):
+    """主机名变更后缓存失效"""
+    _write_stale_cache("stalehost")
+
+    assert SystemDetector()._load_cache() is None
@@ -0,0 +1,64 @@
+"""
+YAML加载模块测试
+"""
+
+import os
+import pickle
+
+import pytest
+
+from netops_toolkit.config import yaml_loader
+from netops_toolkit.config.yaml_loader import load_yaml
+
+
+class _Planted:
+    """反序列化时留下标记的对象"""
+
+    def __reduce__(self):
+        return (os.mkdir, (os.environ["PLANTED_MARKER"],))
+
+
+@pytest.fixture
+def cache_home(tmp_path, monkeypatch):
+    """将用户缓存目录重定向到临时目录"""
+    home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(home))
+    yaml_loader._cache_dir.cache_clear()
+    yield home
+    yaml_loader._cache_dir.cache_clear()
+
+
+def test_config_dir_sidecar_is_never_loaded(tmp_path, cache_home, monkeypatch):
+    """配置目录中放置的 .yaml.pkl 不会被反序列化, 也不会在配置目录写入缓存"""
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    source = config_dir / "settings.yaml"
+    source.write_text("a: 1\n", encoding="utf-8")
+    st = source.stat()
+
+    marker = tmp_path / "planted"
+    monkeypatch.setenv("PLANTED_MARKER", str(marker))
+    with open(config_dir / "settings.yaml.pkl", "wb") as f:
+        pickle.dump(((st.st_mtime_ns, st.st_size), _Planted()), f)
+
+    assert load_yaml(source) == {"a": 1}
+    assert load_yaml(source) == {"a": 1}
+    assert not marker.exists()
+    assert sorted(p.name for p in config_dir.iterdir()) == [
+        "settings.yaml", "settings.yaml.pkl",
+    ]
+
+
+def test_cache_written_to_private_user_dir(tmp_path, cache_home):
+    """解析缓存写入权限为 0700 的用户缓存目录, 源文件变化后重新解析"""
+    source = tmp_path / "devices.yaml"
+    source.write_text("devices: []\n", encoding="utf-8")
+
+    assert load_yaml(source) == {"devices": []}
+    directory = cache_home / "netops_toolkit" / "yaml"
+    assert len(list(directory.iterdir())) == 1
+    if hasattr(os, "getuid"):
+        assert directory.stat().st_mode & 0o777 == 0o700
+
+    source.write_text("devices: [{name: r1, ip: 10.0.0.1}]\n", encoding="utf-8")
+    assert load_yaml(source) == {"devices": [{"name": "r1", "ip": "10.0.0.1"}]}